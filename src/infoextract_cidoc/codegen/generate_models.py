@@ -91,6 +91,8 @@ DO NOT EDIT — regenerate with: make codegen
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from uuid import UUID
 
 from pydantic import Field
@@ -101,9 +103,21 @@ from infoextract_cidoc.models.base import CRMEntity
 '''
 
     classes = "\n\n".join(_generate_class(sv, name) for name in order)
+    table = "".join(f'    "{name.split("_")[0]}": {name},\n' for name in order)
+    footer = f'''
+
+# Generated model class for each class code
+_CODE_TO_CLS: Mapping[str, type[CRMEntity]] = MappingProxyType({{
+{table}}})
+
+
+def entity_class_for(code: str) -> type[CRMEntity]:
+    """Return the generated model class for class code *code* (e.g. "E22")."""
+    return _CODE_TO_CLS[code]
+'''
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(header + classes + "\n")
+    output_path.write_text(header + classes + footer, encoding="utf-8")
 
 
 def main() -> None:
@@ -115,7 +115,7 @@ This module provides:
     p_dict = "P = {\n" + ",\n".join(p_entries) + "\n}\n"
     domain_dict = "DOMAIN = {\n" + ",\n".join(domain_entries) + "\n}\n"
 
-    output_path.write_text(header + p_dict + "\n" + domain_dict)
+    output_path.write_text(header + p_dict + "\n" + domain_dict, encoding="utf-8")
 
 
 def main() -> None:
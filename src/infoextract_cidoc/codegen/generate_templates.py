@@ -15,13 +15,13 @@ def load_yaml_specs(specs_dir: Path) -> Dict[str, Any]:
     properties_file = specs_dir / "crm_properties.yaml"
     aliases_file = specs_dir / "aliases.yaml"
     
-    with open(classes_file, 'r') as f:
+    with open(classes_file, 'r', encoding='utf-8') as f:
         classes = yaml.safe_load(f)
     
-    with open(properties_file, 'r') as f:
+    with open(properties_file, 'r', encoding='utf-8') as f:
         properties = yaml.safe_load(f)
     
-    with open(aliases_file, 'r') as f:
+    with open(aliases_file, 'r', encoding='utf-8') as f:
         aliases = yaml.safe_load(f)
     
     return {
@@ -110,13 +110,13 @@ def generate_templates_file(specs: Dict[str, Any], output_dir: Path) -> None:
         # Generate Markdown template
         markdown_template = generate_markdown_template(class_spec, aliases)
         markdown_file = templates_dir / f"{code}_markdown.j2"
-        with open(markdown_file, 'w') as f:
+        with open(markdown_file, 'w', encoding='utf-8') as f:
             f.write(markdown_template)
         
         # Generate Cypher template
         cypher_template = generate_cypher_template(class_spec)
         cypher_file = templates_dir / f"{code}_cypher.j2"
-        with open(cypher_file, 'w') as f:
+        with open(cypher_file, 'w', encoding='utf-8') as f:
             f.write(cypher_template)
     
     print(f"Generated templates in {templates_dir}")
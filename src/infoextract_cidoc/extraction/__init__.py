@@ -5,6 +5,7 @@ Pipeline:
     LangStructExtractor -> resolve_extraction -> map_to_crm_entities
 """
 
+from .cache import ExtractionCache, cached_extract, cached_extract_many
 from .crm_mapper import map_to_crm_entities
 from .langstruct_extractor import LangStructExtractor
 from .lite_schema import LiteEntity, LiteExtractionResult, LiteRelationship
@@ -26,6 +27,7 @@ __all__ = [
     # Stable extraction models (output of resolution pipeline)
     "ExtractedEntity",
     "ExtractedRelationship",
+    "ExtractionCache",
     "ExtractionResult",
     # Extraction pipeline
     "LangStructExtractor",
@@ -37,6 +39,8 @@ __all__ = [
     "PersonExtraction",
     "PlaceExtraction",
     "TimeExtraction",
+    "cached_extract",
+    "cached_extract_many",
     "map_to_crm_entities",
     "resolve_extraction",
 ]
@@ -0,0 +1,154 @@
+"""On-disk cache for LangStruct extraction results.
+
+Re-running the CLI on the same text (demo reruns, re-analysis with a
+different confidence threshold) should not pay for another LLM round-trip.
+Results are stored as JSON files keyed by a SHA-256 hash of the model id,
+a fingerprint of the prompt and output schema, and the input text, so a
+different model, prompt revision or text never hits a stale entry.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+from pydantic import ValidationError
+
+from infoextract_cidoc.extraction.langstruct_extractor import SYSTEM_PROMPT
+from infoextract_cidoc.extraction.lite_schema import LiteExtractionResult
+
+if TYPE_CHECKING:
+    from infoextract_cidoc.extraction.langstruct_extractor import LangStructExtractor
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory (honours ``XDG_CACHE_HOME``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "infoextract-cidoc"
+
+
+@functools.cache
+def _prompt_fingerprint() -> str:
+    """Hash of the system prompt and output schema sent with every request."""
+    schema = orjson.dumps(
+        LiteExtractionResult.model_json_schema(), option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.sha256(SYSTEM_PROMPT.encode() + b"\0" + schema).hexdigest()
+
+
+def cache_key(model: str, text: str) -> str:
+    """Return the cache key for extracting *text* with *model*."""
+    digest = hashlib.sha256()
+    # Length-prefix each part so ("ab", "c") and ("a", "bc") never collide
+    for part in (model, _prompt_fingerprint(), text):
+        data = part.encode()
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Directory of cached LiteExtractionResult JSON files.
+
+    Args:
+        directory: Cache directory. Defaults to :func:`default_cache_dir`.
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self._directory = Path(directory) if directory else default_cache_dir()
+
+    @property
+    def directory(self) -> Path:
+        """The directory cache entries are stored in."""
+        return self._directory
+
+    def _path(self, model: str, text: str) -> Path:
+        return self._directory / f"{cache_key(model, text)}.json"
+
+    def get(self, model: str, text: str) -> LiteExtractionResult | None:
+        """Return the cached result, or None on a miss or unreadable entry."""
+        path = self._path(model, text)
+        try:
+            return LiteExtractionResult.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError):
+            logger.warning("Ignoring unreadable extraction cache entry %s", path)
+            return None
+
+    def set(self, model: str, text: str, result: LiteExtractionResult) -> None:
+        """Store *result*; the write is atomic so readers never see partial files."""
+        path = self._path(model, text)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(result.model_dump_json(), encoding="utf-8")
+        tmp_path.replace(path)
+
+
+async def cached_extract(
+    extractor: LangStructExtractor,
+    text: str,
+    *,
+    cache: ExtractionCache | None = None,
+) -> LiteExtractionResult:
+    """Extract from *text*, serving repeat requests from the on-disk cache.
+
+    Args:
+        extractor: Extractor used on a cache miss.
+        text: The input text to extract from.
+        cache: Cache to use. Defaults to one in :func:`default_cache_dir`.
+
+    Returns:
+        LiteExtractionResult with entities and relationships.
+    """
+    cache = cache or ExtractionCache()
+    result = cache.get(extractor.model, text)
+    if result is None:
+        result = await extractor.extract_async(text)
+        cache.set(extractor.model, text, result)
+    return result
+
+
+async def cached_extract_many(
+    extractor: LangStructExtractor,
+    texts: list[str],
+    *,
+    cache: ExtractionCache | None = None,
+    max_workers: int | None = None,
+) -> list[LiteExtractionResult]:
+    """Batch variant of :func:`cached_extract`; only cache misses hit the LLM.
+
+    Args:
+        extractor: Extractor used for the cache misses.
+        texts: List of input texts.
+        cache: Cache to use. Defaults to one in :func:`default_cache_dir`.
+        max_workers: Maximum number of concurrent LLM requests.
+
+    Returns:
+        List of LiteExtractionResult, aligned with the input texts.
+    """
+    cache = cache or ExtractionCache()
+    cached = [cache.get(extractor.model, text) for text in texts]
+    misses = [i for i, result in enumerate(cached) if result is None]
+
+    fresh = dict(
+        zip(
+            misses,
+            await extractor.extract_many_async(
+                [texts[i] for i in misses], max_workers=max_workers
+            ),
+            strict=True,
+        )
+    )
+    for i, result in fresh.items():
+        cache.set(extractor.model, texts[i], result)
+
+    # Every miss has a fresh result (zip is strict), so this never drops a slot
+    return [fresh[i] if result is None else result for i, result in enumerate(cached)]
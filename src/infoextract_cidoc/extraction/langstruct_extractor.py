@@ -110,6 +110,31 @@ class LangStructExtractor:
         """
         return await asyncio.to_thread(self.extract, text)
 
+    async def extract_many_async(
+        self, texts: list[str], *, max_workers: int | None = None
+    ) -> list[LiteExtractionResult]:
+        """Extract from multiple texts in one batched call (asynchronous).
+
+        Hands the whole list to LangStruct's batch API, which runs the LLM
+        requests on its own worker pool with rate limiting and retries, so
+        the documents' round-trips overlap instead of running one by one.
+
+        Args:
+            texts: List of input texts.
+            max_workers: Maximum number of concurrent LLM requests
+                (LangStruct's default when None).
+
+        Returns:
+            List of LiteExtractionResult, aligned with the input texts.
+        """
+        if not texts:
+            return []
+        extractor = self._get_extractor()
+        results = await asyncio.to_thread(
+            extractor.extract, list(texts), max_workers=max_workers
+        )
+        return [LiteExtractionResult(**result.entities) for result in results]
+
     def extract_batch(self, texts: list[str]) -> list[LiteExtractionResult]:
         """Extract from multiple texts.
 
@@ -3,7 +3,9 @@ Cypher emitters for CIDOC CRM entities.
 Generates idempotent MERGE/UNWIND scripts for Neo4j and Memgraph.
 """
 
-from collections.abc import Iterable
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 from typing import Any
 
 from infoextract_cidoc.models.base import CRMEntity
@@ -106,101 +108,144 @@ def expand_shortcuts(entity: CRMEntity) -> list[dict[str, Any]]:
     return rels
 
 
-def generate_cypher_script(
+def iter_cypher_statements(
     entities: Iterable[CRMEntity],
     *,
     include_constraints: bool = True,
     batch_size: int = 1000,
-) -> str:
+) -> Iterator[str]:
     """
-    Generate a complete Cypher script for entities.
+    Yield a Cypher script for entities one line at a time.
+
+    Joining the lines with newlines gives exactly :func:`generate_cypher_script`,
+    so large scripts can be written out without building one giant string.
 
     Args:
         entities: Iterable of CRM entities
         include_constraints: Whether to include constraint creation
         batch_size: Batch size for UNWIND operations
 
-    Returns:
-        Complete Cypher script as string
+    Yields:
+        Script lines, without trailing newlines
     """
-    # Get node and relationship data
-    node_data = emit_nodes(entities)
-    rel_data = emit_relationships(entities)
+    entities = list(entities)
+    nodes = emit_nodes(entities)["nodes"]
+    rels = emit_relationships(entities)["rels"]
 
-    script_parts = []
+    sections: list[Iterator[str]] = []
 
     # Add constraints if requested
     if include_constraints:
-        script_parts.append(_generate_constraints())
+        sections.append(_iter_constraint_lines())
 
     # Add node creation
-    if node_data["nodes"]:
-        script_parts.append(_generate_node_script(node_data["nodes"], batch_size))
+    if nodes:
+        sections.append(_iter_node_lines(len(nodes), batch_size))
 
     # Add relationship creation
-    if rel_data["rels"]:
-        script_parts.append(_generate_relationship_script(rel_data["rels"], batch_size))
+    if rels:
+        sections.append(_iter_relationship_lines(rels, batch_size))
 
-    return "\n\n".join(script_parts)
+    # Sections are separated by a blank line
+    for i, section in enumerate(sections):
+        if i:
+            yield ""
+        yield from section
 
 
-def _generate_constraints() -> str:
-    """Generate constraint creation statements."""
-    return """-- Create constraints
-CREATE CONSTRAINT crm_id IF NOT EXISTS FOR (n:CRM) REQUIRE n.id IS UNIQUE;
-CREATE CONSTRAINT crm_class_code IF NOT EXISTS FOR (n:CRM) REQUIRE n.class_code IS NOT NULL;"""
-
-
-def _generate_node_script(nodes: list[dict[str, Any]], batch_size: int) -> str:
-    """Generate node creation script."""
-    if not nodes:
-        return ""
+def generate_cypher_script(
+    entities: Iterable[CRMEntity],
+    *,
+    include_constraints: bool = True,
+    batch_size: int = 1000,
+) -> str:
+    """
+    Generate a complete Cypher script for entities.
 
-    script_parts = ["-- Create nodes"]
+    Args:
+        entities: Iterable of CRM entities
+        include_constraints: Whether to include constraint creation
+        batch_size: Batch size for UNWIND operations
 
-    # Process nodes in batches
-    for i in range(0, len(nodes), batch_size):
-        nodes[i : i + batch_size]
-        script_parts.append(f"UNWIND $nodes_{i // batch_size} AS n")
-        script_parts.append("MERGE (x:CRM {id: n.id})")
-        script_parts.append("SET x.label = coalesce(n.label, x.label)")
-        script_parts.append("SET x.class_code = n.class_code")
-        script_parts.append("SET x.notes = coalesce(n.notes, x.notes)")
-        script_parts.append(
-            "SET x.source_text = coalesce(n.source_text, x.source_text)"
+    Returns:
+        Complete Cypher script as string
+    """
+    return "\n".join(
+        iter_cypher_statements(
+            entities, include_constraints=include_constraints, batch_size=batch_size
         )
-        script_parts.append("SET x.type = coalesce(n.type, x.type);")
-        script_parts.append("")
+    )
 
-    return "\n".join(script_parts)
 
+def write_cypher_script(
+    entities: Iterable[CRMEntity],
+    path: str | Path,
+    *,
+    include_constraints: bool = True,
+    batch_size: int = 1000,
+) -> None:
+    """
+    Stream the Cypher script for entities to a file.
 
-def _generate_relationship_script(rels: list[dict[str, Any]], batch_size: int) -> str:
-    """Generate relationship creation script."""
-    if not rels:
-        return ""
-
+    Args:
+        entities: Iterable of CRM entities
+        path: Destination file; written as UTF-8
+        include_constraints: Whether to include constraint creation
+        batch_size: Batch size for UNWIND operations
+    """
+    lines = iter_cypher_statements(
+        entities, include_constraints=include_constraints, batch_size=batch_size
+    )
+    with Path(path).open("w", encoding="utf-8") as f:
+        f.write(next(lines, ""))
+        for line in lines:
+            f.write("\n")
+            f.write(line)
+
+
+def _iter_constraint_lines() -> Iterator[str]:
+    """Yield constraint creation statements."""
+    yield "-- Create constraints"
+    yield ("CREATE CONSTRAINT crm_id IF NOT EXISTS FOR (n:CRM) REQUIRE n.id IS UNIQUE;")
+    yield (
+        "CREATE CONSTRAINT crm_class_code IF NOT EXISTS "
+        "FOR (n:CRM) REQUIRE n.class_code IS NOT NULL;"
+    )
+
+
+def _iter_node_lines(node_count: int, batch_size: int) -> Iterator[str]:
+    """Yield the node creation script for *node_count* nodes."""
+    yield "-- Create nodes"
+
+    # One UNWIND block per parameter batch
+    for batch in range(-(-node_count // batch_size)):
+        yield f"UNWIND $nodes_{batch} AS n"
+        yield "MERGE (x:CRM {id: n.id})"
+        yield "SET x.label = coalesce(n.label, x.label)"
+        yield "SET x.class_code = n.class_code"
+        yield "SET x.notes = coalesce(n.notes, x.notes)"
+        yield "SET x.source_text = coalesce(n.source_text, x.source_text)"
+        yield "SET x.type = coalesce(n.type, x.type);"
+        yield ""
+
+
+def _iter_relationship_lines(
+    rels: list[dict[str, Any]], batch_size: int
+) -> Iterator[str]:
+    """Yield the relationship creation script."""
     # Group relationships by type
-    rels_by_type: dict[str, list[dict[str, Any]]] = {}
-    for rel in rels:
-        rel_type = rel["type"]
-        if rel_type not in rels_by_type:
-            rels_by_type[rel_type] = []
-        rels_by_type[rel_type].append(rel)
-
-    script_parts = ["-- Create relationships"]
-
-    for rel_type, type_rels in rels_by_type.items():
-        # Process relationships in batches
-        for i in range(0, len(type_rels), batch_size):
-            type_rels[i : i + batch_size]
-            script_parts.append(f"UNWIND $rels_{rel_type}_{i // batch_size} AS r")
-            script_parts.append("MATCH (s:CRM {id: r.src})")
-            script_parts.append("MATCH (t:CRM {id: r.tgt})")
-            script_parts.append(f"MERGE (s)-[:`{rel_type}`]->(t);")
-            script_parts.append("")
-
-    return "\n".join(script_parts)
+    counts_by_type = Counter(rel["type"] for rel in rels)
+
+    yield "-- Create relationships"
+
+    for rel_type, count in counts_by_type.items():
+        # One UNWIND block per parameter batch
+        for batch in range(-(-count // batch_size)):
+            yield f"UNWIND $rels_{rel_type}_{batch} AS r"
+            yield "MATCH (s:CRM {id: r.src})"
+            yield "MATCH (t:CRM {id: r.tgt})"
+            yield f"MERGE (s)-[:`{rel_type}`]->(t);"
+            yield ""
 
 
 def generate_cypher_parameters(
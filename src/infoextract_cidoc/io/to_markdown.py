@@ -7,7 +7,7 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from infoextract_cidoc.models.base import CRMEntity
+from infoextract_cidoc.models.base import SUBCLASS_CODES, CRMEntity
 
 
 class MarkdownStyle(str, Enum):
@@ -19,6 +19,55 @@ class MarkdownStyle(str, Enum):
     NARRATIVE = "narrative"
 
 
+# Default friendly names for common classes
+_DEFAULT_CLASS_ALIASES: dict[str, str] = {
+    "E1": "CRM Entity",
+    "E5": "Event",
+    "E7": "Activity",
+    "E8": "Acquisition",
+    "E12": "Production",
+    "E21": "Person",
+    "E22": "Human-Made Object",
+    "E53": "Place",
+    "E52": "Time-Span",
+    "E42": "Identifier",
+    "E35": "Title",
+}
+
+# Default friendly names for common properties
+_DEFAULT_PROPERTY_ALIASES: dict[str, str] = {
+    "label": "Label",
+    "type": "Type",
+    "notes": "Notes",
+    "source_text": "Source",
+    "timespan": "Time-Span",
+    "took_place_at": "Location",
+    "current_location": "Location",
+    "produced_by": "Produced By",
+    "begin_of_the_begin": "Start",
+    "end_of_the_end": "End",
+}
+
+# Canonical fields shown on cards, per class (shared tuples, not per-class lists)
+_DEFAULT_CANONICAL_FIELDS = ("label", "type")
+_EVENT_CANONICAL_FIELDS = (*_DEFAULT_CANONICAL_FIELDS, "timespan", "took_place_at")
+_CANONICAL_FIELDS: dict[str, tuple[str, ...]] = {
+    "E5": _EVENT_CANONICAL_FIELDS,
+    "E7": _EVENT_CANONICAL_FIELDS,
+    "E8": _EVENT_CANONICAL_FIELDS,
+    "E12": _EVENT_CANONICAL_FIELDS,
+    "E21": (*_DEFAULT_CANONICAL_FIELDS, "current_location"),
+    "E22": (*_DEFAULT_CANONICAL_FIELDS, "current_location", "produced_by"),
+    "E53": _DEFAULT_CANONICAL_FIELDS,
+    "E52": (*_DEFAULT_CANONICAL_FIELDS, "begin_of_the_begin", "end_of_the_end"),
+    "E42": _DEFAULT_CANONICAL_FIELDS,
+    "E35": _DEFAULT_CANONICAL_FIELDS,
+}
+
+# Shortest string uuid.UUID() can parse: 32 hex digits without hyphens
+_MIN_UUID_STR_LEN = 32
+
+
 def to_markdown(
     entity: CRMEntity,
     style: MarkdownStyle = MarkdownStyle.CARD,
@@ -132,9 +181,13 @@ def _render_detailed(
     # Build detailed body
     body_lines = []
 
-    # Add all non-empty fields
-    for field_name, field_value in entity.dict().items():
-        if field_value and field_name not in ["id", "class_code"]:
+    # Add all non-empty fields; read attributes directly rather than paying
+    # for a full model_dump() per entity
+    for field_name in type(entity).model_fields:
+        if field_name in {"id", "class_code"}:
+            continue
+        field_value = getattr(entity, field_name)
+        if field_value:
             friendly_name = _get_friendly_property_name(field_name, aliases)
             formatted_value = _format_uuid_for_display(field_value)
             if show_codes:
@@ -198,7 +251,7 @@ def _render_narrative(
 
     narrative_parts.append(f"is a {class_name.lower()}")
 
-    if entity.class_code in ["E5", "E7", "E8", "E12"]:
+    if entity.class_code in SUBCLASS_CODES["E5"]:
         # Event-specific narrative
         if hasattr(entity, "timespan") and entity.timespan:
             narrative_parts.append(
@@ -239,22 +292,7 @@ def _get_friendly_class_name(class_code: str, aliases: dict[str, str] | None) ->
     if aliases and class_code in aliases:
         return aliases[class_code]
 
-    # Default mapping for common classes
-    default_aliases = {
-        "E1": "CRM Entity",
-        "E5": "Event",
-        "E7": "Activity",
-        "E8": "Acquisition",
-        "E12": "Production",
-        "E21": "Person",
-        "E22": "Human-Made Object",
-        "E53": "Place",
-        "E52": "Time-Span",
-        "E42": "Identifier",
-        "E35": "Title",
-    }
-
-    return default_aliases.get(class_code, f"E{class_code}")
+    return _DEFAULT_CLASS_ALIASES.get(class_code, f"E{class_code}")
 
 
 def _get_friendly_property_name(
@@ -264,41 +302,17 @@ def _get_friendly_property_name(
     if aliases and property_name in aliases:
         return aliases[property_name]
 
-    # Default mapping for common properties
-    default_aliases = {
-        "label": "Label",
-        "type": "Type",
-        "notes": "Notes",
-        "source_text": "Source",
-        "timespan": "Time-Span",
-        "took_place_at": "Location",
-        "current_location": "Location",
-        "produced_by": "Produced By",
-        "begin_of_the_begin": "Start",
-        "end_of_the_end": "End",
-    }
+    friendly_name = _DEFAULT_PROPERTY_ALIASES.get(property_name)
+    if friendly_name is None:
+        friendly_name = property_name.replace("_", " ").title()
+    return friendly_name
 
-    return default_aliases.get(property_name, property_name.replace("_", " ").title())
 
-
-def _get_canonical_fields(entity: CRMEntity) -> list[str]:
+def _get_canonical_fields(entity: CRMEntity) -> tuple[str, ...]:
     """Get canonical fields for an entity based on its class."""
     # This would ideally come from the class metadata
     # For now, use a simple mapping
-    canonical_mapping = {
-        "E5": ["label", "type", "timespan", "took_place_at"],
-        "E7": ["label", "type", "timespan", "took_place_at"],
-        "E8": ["label", "type", "timespan", "took_place_at"],
-        "E12": ["label", "type", "timespan", "took_place_at"],
-        "E21": ["label", "type", "current_location"],
-        "E22": ["label", "type", "current_location", "produced_by"],
-        "E53": ["label", "type"],
-        "E52": ["label", "type", "begin_of_the_begin", "end_of_the_end"],
-        "E42": ["label", "type"],
-        "E35": ["label", "type"],
-    }
-
-    return canonical_mapping.get(entity.class_code, ["label", "type"])
+    return _CANONICAL_FIELDS.get(entity.class_code, _DEFAULT_CANONICAL_FIELDS)
 
 
 def _get_field_value(entity: CRMEntity, field_name: str) -> Any:
@@ -314,6 +328,9 @@ def _format_uuid_for_display(uuid_value: Any) -> str:
         # Show first 8 characters for readability
         return str(uuid_value)[:8] + "..."
     if isinstance(uuid_value, str):
+        if len(uuid_value) < _MIN_UUID_STR_LEN:
+            # Too short to be a UUID; skip the failing parse
+            return uuid_value
         try:
             # Try to parse as UUID
             uuid_obj = UUID(uuid_value)
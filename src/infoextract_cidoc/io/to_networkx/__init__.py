@@ -12,9 +12,11 @@ from .analysis import (
     get_network_statistics,
 )
 from .converters import (
+    count_entity_types,
     entities_to_networkx,
     extract_edge_attributes,
     extract_node_attributes,
+    extract_node_attributes_grouped,
     relationships_to_edges,
 )
 from .graph_builder import (
@@ -22,6 +24,7 @@ from .graph_builder import (
     build_graph_from_entities,
     create_temporal_graph,
     to_networkx_graph,
+    to_networkx_graph_from_dicts,
 )
 
 __all__ = [
@@ -29,12 +32,15 @@ __all__ = [
     "analyze_temporal_patterns",
     "build_graph_from_entities",
     "calculate_centrality_measures",
+    "count_entity_types",
     "create_temporal_graph",
     "entities_to_networkx",
     "extract_edge_attributes",
     "extract_node_attributes",
+    "extract_node_attributes_grouped",
     "find_communities",
     "get_network_statistics",
     "relationships_to_edges",
     "to_networkx_graph",
+    "to_networkx_graph_from_dicts",
 ]
@@ -10,14 +10,17 @@ from typing import Any
 
 import networkx as nx
 
+from infoextract_cidoc.io.to_networkx.converters import count_entity_types
 
-def calculate_centrality_measures(
+
+def calculate_centrality_measures(  # noqa: PLR0913
     graph: nx.Graph,
     *,
     include_betweenness: bool = True,
     include_closeness: bool = True,
     include_eigenvector: bool = True,
     include_pagerank: bool = True,
+    backend: str | None = None,
 ) -> dict[str, dict[str, float]]:
     """
     Calculate various centrality measures for nodes in the graph.
@@ -28,6 +31,9 @@ def calculate_centrality_measures(
         include_closeness: Whether to calculate closeness centrality
         include_eigenvector: Whether to calculate eigenvector centrality
         include_pagerank: Whether to calculate PageRank centrality
+        backend: NetworkX dispatch backend to run on (e.g. ``"graphblas"``
+            with ``graphblas-algorithms`` installed); None uses NetworkX's
+            default dispatching
 
     Returns:
         Dictionary mapping centrality type to node centrality scores
@@ -35,33 +41,39 @@ def calculate_centrality_measures(
     centrality_measures = {}
 
     # Degree centrality
-    centrality_measures["degree"] = nx.degree_centrality(graph)
+    centrality_measures["degree"] = nx.degree_centrality(graph, backend=backend)
 
     # Betweenness centrality
     if include_betweenness:
         try:
-            centrality_measures["betweenness"] = nx.betweenness_centrality(graph)
+            centrality_measures["betweenness"] = nx.betweenness_centrality(
+                graph, backend=backend
+            )
         except nx.NetworkXError:
             centrality_measures["betweenness"] = {}
 
     # Closeness centrality
     if include_closeness:
         try:
-            centrality_measures["closeness"] = nx.closeness_centrality(graph)
+            centrality_measures["closeness"] = nx.closeness_centrality(
+                graph, backend=backend
+            )
         except nx.NetworkXError:
             centrality_measures["closeness"] = {}
 
     # Eigenvector centrality
     if include_eigenvector:
         try:
-            centrality_measures["eigenvector"] = nx.eigenvector_centrality(graph)
+            centrality_measures["eigenvector"] = nx.eigenvector_centrality(
+                graph, backend=backend
+            )
         except nx.NetworkXError:
             centrality_measures["eigenvector"] = {}
 
     # PageRank
     if include_pagerank:
         try:
-            centrality_measures["pagerank"] = nx.pagerank(graph)
+            centrality_measures["pagerank"] = nx.pagerank(graph, backend=backend)
         except nx.NetworkXError:
             centrality_measures["pagerank"] = {}
 
@@ -73,14 +85,18 @@ def find_communities(
     *,
     algorithm: str = "greedy_modularity",
     min_community_size: int = 2,
+    backend: str | None = None,
 ) -> list[list[str]]:
     """
     Find communities in the graph using various algorithms.
 
     Args:
         graph: NetworkX graph
-        algorithm: Community detection algorithm to use
+        algorithm: Community detection algorithm to use ("greedy_modularity",
+            "louvain", "label_propagation" or "asyn_lpa")
         min_community_size: Minimum size for communities to include
+        backend: NetworkX dispatch backend to run on; None uses NetworkX's
+            default dispatching
 
     Returns:
         List of communities, where each community is a list of node IDs
@@ -89,17 +105,30 @@ def find_communities(
 
     if algorithm == "greedy_modularity":
         try:
-            communities = list(nx.community.greedy_modularity_communities(graph))
+            communities = list(
+                nx.community.greedy_modularity_communities(graph, backend=backend)
+            )
+        except nx.NetworkXError:
+            communities = []
+    elif algorithm == "louvain":
+        try:
+            communities = nx.community.louvain_communities(
+                graph, seed=0, backend=backend
+            )
         except nx.NetworkXError:
             communities = []
     elif algorithm == "label_propagation":
         try:
-            communities = list(nx.community.label_propagation_communities(graph))
+            communities = list(
+                nx.community.label_propagation_communities(graph, backend=backend)
+            )
         except nx.NetworkXError:
             communities = []
     elif algorithm == "asyn_lpa":
         try:
-            communities = list(nx.community.asyn_lpa_communities(graph))
+            communities = list(
+                nx.community.asyn_lpa_communities(graph, backend=backend)
+            )
         except nx.NetworkXError:
             communities = []
     else:
@@ -201,13 +230,7 @@ def get_network_statistics(graph: nx.Graph) -> dict[str, Any]:
         }
 
     # Entity type distribution
-    entity_types: defaultdict[str, int] = defaultdict(int)
-    for node_id in graph.nodes():
-        node_data = graph.nodes[node_id]
-        class_code = node_data.get("class_code", "Unknown")
-        entity_types[class_code] += 1
-
-    stats["entity_type_distribution"] = dict(entity_types)
+    stats["entity_type_distribution"] = count_entity_types(graph)
 
     # Relationship type distribution
     relationship_types: defaultdict[str, int] = defaultdict(int)
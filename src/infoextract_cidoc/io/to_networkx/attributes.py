@@ -0,0 +1,40 @@
+"""
+Attribute helpers shared by the NetworkX graph builders and converters.
+
+These are internal building blocks for :mod:`.converters` and
+:mod:`.graph_builder`; they are not re-exported from the package.
+"""
+
+from functools import cache
+from typing import Any
+
+from infoextract_cidoc.models.base import CRMEntity
+
+
+class IdStrCache(dict[Any, str]):
+    """Memoize ``str(node_id)`` so each UUID is formatted only once per build."""
+
+    def __missing__(self, key: Any) -> str:
+        value = self[key] = str(key)
+        return value
+
+
+@cache
+def _dump_fields(cls: type[CRMEntity], exclude: frozenset[str]) -> tuple[str, ...]:
+    """Names of *cls*'s fields that are not in *exclude*, resolved once per class."""
+    return tuple(name for name in cls.model_fields if name not in exclude)
+
+
+def entity_attributes(entity: CRMEntity, exclude: frozenset[str]) -> dict[str, Any]:
+    """Equivalent of ``entity.model_dump(exclude=exclude)`` for flat CRM models.
+
+    CRM entity fields are scalars, UUIDs and string lists, so reading them
+    straight from the instance (copying lists) matches pydantic's output
+    without a trip through the serializer.
+    """
+    values = entity.__dict__
+    attributes = {}
+    for name in _dump_fields(type(entity), exclude):
+        value = values[name]
+        attributes[name] = value.copy() if type(value) is list else value
+    return attributes
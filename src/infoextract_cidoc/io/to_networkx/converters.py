@@ -4,13 +4,26 @@ Utility functions for converting between CRM entities and NetworkX formats.
 This module provides helper functions for data conversion and attribute extraction.
 """
 
-from typing import Any
+from collections import Counter, defaultdict
+from operator import attrgetter
+from sys import intern
+from typing import TYPE_CHECKING, Any
 
 import networkx as nx
+import orjson
 
 from infoextract_cidoc.extraction.models import ExtractedEntity, ExtractedRelationship
+from infoextract_cidoc.io.to_networkx.attributes import IdStrCache, entity_attributes
 from infoextract_cidoc.models.base import CRMEntity, CRMRelation
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def _is_simple_digraph(graph: nx.Graph) -> bool:
+    """Whether *graph* stores each edge once in plain successor dicts."""
+    return graph.is_directed() and not graph.is_multigraph()
+
 
 def entities_to_networkx(
     entities: list[CRMEntity],
@@ -34,26 +47,22 @@ def entities_to_networkx(
     node_ids = []
     node_data_list = []
 
+    # Resolve the field lookups once instead of per entity
+    get_node_id = attrgetter(node_id_field)
+    get_label = attrgetter(label_field)
+    excluded_fields = frozenset({node_id_field, "class_code"})
+
     for entity in entities:
-        # Get node ID
-        node_id = str(getattr(entity, node_id_field))
-        node_ids.append(node_id)
-
-        # Get node data
-        node_data = {
-            "class_code": entity.class_code,
-            "label": getattr(entity, label_field, None),
-        }
+        node_ids.append(str(get_node_id(entity)))
+
+        try:
+            label = get_label(entity)
+        except AttributeError:
+            label = None
 
+        node_data = {"class_code": intern(entity.class_code), "label": label}
         if include_all_attributes:
-            entity_dict = entity.dict()
-            node_data.update(
-                {
-                    k: v
-                    for k, v in entity_dict.items()
-                    if k not in [node_id_field, "class_code"]
-                }
-            )
+            node_data.update(entity_attributes(entity, excluded_fields))
 
         node_data_list.append(node_data)
 
@@ -76,16 +85,17 @@ def relationships_to_edges(
         List of (source_id, target_id, edge_data) tuples
     """
     edges = []
+    node_ids = IdStrCache()
 
     for rel in relationships:
         edge_data = {
-            "property_code": rel.type,
+            "property_code": intern(rel.type),
         }
 
         if include_properties and rel.props:
             edge_data.update(rel.props)
 
-        edges.append((str(rel.src), str(rel.tgt), edge_data))
+        edges.append((node_ids[rel.src], node_ids[rel.tgt], edge_data))
 
     return edges
 
@@ -107,13 +117,35 @@ def extract_node_attributes(
     Returns:
         Dictionary mapping node_id to attribute value
     """
-    attributes = {}
+    return dict(graph.nodes(data=attribute_name, default=default_value))
+
+
+def extract_node_attributes_grouped(
+    graph: nx.Graph,
+    attribute_name: str,
+    *,
+    default_value: Any = None,
+) -> dict[Any, list[str]]:
+    """
+    Group nodes by the value of a specific attribute in a single pass.
+
+    This is the inverse of :func:`extract_node_attributes` without building
+    the intermediate node-to-value mapping.
+
+    Args:
+        graph: NetworkX graph
+        attribute_name: Name of the attribute to group by
+        default_value: Group key for nodes without the attribute
+
+    Returns:
+        Dictionary mapping attribute value to the list of node ids
+    """
+    groups: defaultdict[Any, list[str]] = defaultdict(list)
 
-    for node_id in graph.nodes():
-        node_data = graph.nodes[node_id]
-        attributes[node_id] = node_data.get(attribute_name, default_value)
+    for node_id, value in graph.nodes(data=attribute_name, default=default_value):
+        groups[value].append(node_id)
 
-    return attributes
+    return dict(groups)
 
 
 def extract_edge_attributes(
@@ -133,59 +165,92 @@ def extract_edge_attributes(
     Returns:
         Dictionary mapping (source_id, target_id) to attribute value
     """
-    attributes = {}
-
-    for edge in graph.edges(data=True):
-        source, target, edge_data = edge
-        attributes[(source, target)] = edge_data.get(attribute_name, default_value)
+    if _is_simple_digraph(graph):
+        # adjacency() yields the raw successor dicts, skipping the edge view
+        return {
+            (source, target): edge_data.get(attribute_name, default_value)
+            for source, successors in graph.adjacency()
+            for target, edge_data in successors.items()
+        }
 
-    return attributes
+    return {
+        (source, target): edge_data.get(attribute_name, default_value)
+        for source, target, edge_data in graph.edges(data=True)
+    }
 
 
-def filter_graph_by_attribute(
+def filter_graph_by_attribute(  # noqa: PLR0913
     graph: nx.Graph,
     attribute_name: str,
     attribute_value: Any,
     *,
     filter_nodes: bool = True,
     filter_edges: bool = False,
+    inplace: bool = False,
 ) -> nx.Graph:
     """
     Filter graph to include only nodes/edges with specific attribute values.
 
+    By default the result is a read-only view of *graph* (see
+    ``networkx.subgraph_view``), so no adjacency data is copied. Call
+    ``.copy()`` on the result if a mutable, detached graph is needed.
+
     Args:
         graph: Original NetworkX graph
         attribute_name: Name of the attribute to filter on
         attribute_value: Value to filter for
         filter_nodes: Whether to filter nodes
         filter_edges: Whether to filter edges
+        inplace: Remove non-matching nodes/edges from *graph* itself instead
+            of returning a view. Use this when the input graph is disposable.
 
     Returns:
-        Filtered NetworkX graph
+        Filtered NetworkX graph (a view unless ``inplace`` is set)
     """
-    filtered_graph = graph.copy()
-
-    # Filter nodes
-    if filter_nodes:
-        nodes_to_remove = []
-        for node_id in filtered_graph.nodes():
-            node_data = filtered_graph.nodes[node_id]
-            if node_data.get(attribute_name) != attribute_value:
-                nodes_to_remove.append(node_id)
-
-        filtered_graph.remove_nodes_from(nodes_to_remove)
-
-    # Filter edges
-    if filter_edges:
-        edges_to_remove = []
-        for edge in filtered_graph.edges(data=True):
-            source, target, edge_data = edge
-            if edge_data.get(attribute_name) != attribute_value:
-                edges_to_remove.append((source, target))
-
-        filtered_graph.remove_edges_from(edges_to_remove)
-
-    return filtered_graph
+    if inplace:
+        if filter_nodes:
+            nodes_to_remove = [
+                node_id
+                for node_id, node_data in graph.nodes(data=True)
+                if node_data.get(attribute_name) != attribute_value
+            ]
+            graph.remove_nodes_from(nodes_to_remove)
+
+        if filter_edges:
+            edge_items: Iterable[tuple[Any, Any, dict[str, Any]]] = graph.edges(
+                data=True
+            )
+            if _is_simple_digraph(graph):
+                edge_items = (
+                    (source, target, edge_data)
+                    for source, successors in graph.adjacency()
+                    for target, edge_data in successors.items()
+                )
+            edges_to_remove = [
+                (source, target)
+                for source, target, edge_data in edge_items
+                if edge_data.get(attribute_name) != attribute_value
+            ]
+            graph.remove_edges_from(edges_to_remove)
+
+        return graph
+
+    node_data = graph.nodes
+
+    def _node_pred(node_id: Any) -> bool:
+        return bool(node_data[node_id].get(attribute_name) == attribute_value)
+
+    def _edge_pred(source: Any, target: Any, *key: Any) -> bool:
+        edge_data = graph[source][target]
+        if key:  # multigraphs pass the edge key as well
+            edge_data = edge_data[key[0]]
+        return bool(edge_data.get(attribute_name) == attribute_value)
+
+    return nx.subgraph_view(
+        graph,
+        filter_node=_node_pred if filter_nodes else nx.filters.no_filter,
+        filter_edge=_edge_pred if filter_edges else nx.filters.no_filter,
+    )
 
 
 def get_subgraph_by_entity_type(
@@ -206,11 +271,9 @@ def get_subgraph_by_entity_type(
         Subgraph containing only the specified entity type
     """
     # Find nodes of the specified type
-    nodes_of_type = []
-    for node_id in graph.nodes():
-        node_data = graph.nodes[node_id]
-        if node_data.get("class_code") == entity_type:
-            nodes_of_type.append(node_id)
+    nodes_of_type = extract_node_attributes_grouped(graph, "class_code").get(
+        entity_type, []
+    )
 
     # Create subgraph
     if include_relationships:
@@ -224,6 +287,28 @@ def get_subgraph_by_entity_type(
     return subgraph
 
 
+def count_entity_types(
+    graph: nx.Graph,
+    *,
+    default_value: str = "Unknown",
+) -> dict[str, int]:
+    """
+    Count nodes per CRM class code in a single pass.
+
+    Args:
+        graph: NetworkX graph
+        default_value: Class code to count nodes without a ``class_code`` under
+
+    Returns:
+        Dictionary mapping class code to node count
+    """
+    return dict(
+        Counter(
+            code for _, code in graph.nodes(data="class_code", default=default_value)
+        )
+    )
+
+
 def convert_extracted_to_networkx(
     extracted_entities: list[ExtractedEntity],
     extracted_relationships: list[ExtractedRelationship],
@@ -243,35 +328,48 @@ def convert_extracted_to_networkx(
     """
     graph = nx.DiGraph()
 
-    # Add entities as nodes
-    for entity in extracted_entities:
-        if entity.confidence >= min_confidence:
-            graph.add_node(
-                str(entity.id),
-                class_code=entity.class_code,
-                label=entity.label,
-                description=entity.description,
-                confidence=entity.confidence,
-                source_text=entity.source_text,
+    # Stringify each admitted id once; the map doubles as the admission set
+    # for relationship endpoints.
+    admitted = [e for e in extracted_entities if e.confidence >= min_confidence]
+    node_ids = {entity.id: str(entity.id) for entity in admitted}
+
+    # Add entities as nodes; free-form properties are merged first so they
+    # can never shadow the core attributes.
+    graph.add_nodes_from(
+        (
+            node_ids[entity.id],
+            {
                 **entity.properties,
-            )
+                "class_code": intern(entity.class_code),
+                "label": entity.label,
+                "description": entity.description,
+                "confidence": entity.confidence,
+                "source_text": entity.source_text,
+            },
+        )
+        for entity in admitted
+    )
 
     # Add relationships as edges
+    edges = []
     for rel in extracted_relationships:
-        if (
-            rel.confidence >= min_confidence
-            and graph.has_node(str(rel.source_id))
-            and graph.has_node(str(rel.target_id))
-        ):
-            graph.add_edge(
-                str(rel.source_id),
-                str(rel.target_id),
-                property_code=rel.property_code,
-                property_label=rel.property_label,
-                confidence=rel.confidence,
-                source_text=rel.source_text,
-                **rel.properties,
+        source = node_ids.get(rel.source_id)
+        target = node_ids.get(rel.target_id)
+        if source and target and rel.confidence >= min_confidence:
+            edges.append(
+                (
+                    source,
+                    target,
+                    {
+                        **rel.properties,
+                        "property_code": intern(rel.property_code),
+                        "property_label": rel.property_label,
+                        "confidence": rel.confidence,
+                        "source_text": rel.source_text,
+                    },
+                )
             )
+    graph.add_edges_from(edges)
 
     return graph
 
@@ -280,6 +378,7 @@ def merge_graphs(
     graphs: list[nx.Graph],
     *,
     merge_strategy: str = "union",
+    copy: bool = False,
 ) -> nx.Graph:
     """
     Merge multiple NetworkX graphs.
@@ -287,28 +386,100 @@ def merge_graphs(
     Args:
         graphs: List of NetworkX graphs to merge
         merge_strategy: Strategy for merging ("union", "intersection")
+        copy: Return an independent copy when only one graph is given
+            (by default that graph is returned as-is)
 
     Returns:
         Merged NetworkX graph
+
+    Raises:
+        ValueError: If ``merge_strategy`` is not recognised
     """
+    if merge_strategy not in {"union", "intersection"}:
+        msg = f"Unknown merge strategy: {merge_strategy}"
+        raise ValueError(msg)
+
     if not graphs:
         return nx.Graph()
 
     if len(graphs) == 1:
-        return graphs[0]
+        return graphs[0].copy() if copy else graphs[0]
+
+    # Both build a fresh graph and bulk-insert every input in one pass, so the
+    # first graph is never deep-copied up front.
+    if merge_strategy == "union":
+        return nx.compose_all(graphs)
+    return nx.intersection_all(graphs)
+
+
+def export_graph_to_records(
+    graph: nx.Graph,
+    *,
+    include_node_attributes: bool = True,
+    include_edge_attributes: bool = True,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Export NetworkX graph to plain node and edge record lists.
+
+    Args:
+        graph: NetworkX graph
+        include_node_attributes: Whether to include node attributes
+        include_edge_attributes: Whether to include edge attributes
+
+    Returns:
+        Tuple of (node_records, edge_records); node records carry a
+        ``node_id`` key, edge records ``source`` and ``target`` keys
+    """
+    if include_node_attributes:
+        node_records = [
+            {"node_id": node_id, **node_data}
+            for node_id, node_data in graph.nodes(data=True)
+        ]
+    else:
+        node_records = [{"node_id": node_id} for node_id in graph.nodes()]
+
+    if include_edge_attributes:
+        edge_records = [
+            {"source": source, "target": target, **edge_data}
+            for source, target, edge_data in graph.edges(data=True)
+        ]
+    else:
+        edge_records = [
+            {"source": source, "target": target} for source, target in graph.edges()
+        ]
+
+    return node_records, edge_records
+
+
+def export_graph_to_json_bytes(
+    graph: nx.Graph,
+    *,
+    include_node_attributes: bool = True,
+    include_edge_attributes: bool = True,
+) -> bytes:
+    """
+    Serialize a NetworkX graph to JSON with orjson, without going through pandas.
 
-    merged_graph = graphs[0].copy()
+    Values orjson cannot encode natively fall back to ``str``.
 
-    for graph in graphs[1:]:
-        if merge_strategy == "union":
-            merged_graph = nx.compose(merged_graph, graph)
-        elif merge_strategy == "intersection":
-            merged_graph = nx.intersection(merged_graph, graph)
-        else:
-            msg = f"Unknown merge strategy: {merge_strategy}"
-            raise ValueError(msg)
+    Args:
+        graph: NetworkX graph
+        include_node_attributes: Whether to include node attributes
+        include_edge_attributes: Whether to include edge attributes
 
-    return merged_graph
+    Returns:
+        UTF-8 encoded JSON object with ``nodes`` and ``edges`` arrays
+    """
+    node_records, edge_records = export_graph_to_records(
+        graph,
+        include_node_attributes=include_node_attributes,
+        include_edge_attributes=include_edge_attributes,
+    )
+    return orjson.dumps(
+        {"nodes": node_records, "edges": edge_records},
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
 
 
 def export_graph_to_dataframe(
@@ -330,25 +501,13 @@ def export_graph_to_dataframe(
     """
     import pandas as pd  # noqa: PLC0415
 
-    # Export nodes
-    nodes_data = []
-    for node_id in graph.nodes():
-        node_data = {"node_id": node_id}
-        if include_node_attributes:
-            node_data.update(graph.nodes[node_id])
-        nodes_data.append(node_data)
-
-    nodes_df = pd.DataFrame(nodes_data)
-
-    # Export edges
-    edges_data = []
-    for edge in graph.edges(data=True):
-        source, target, edge_data = edge
-        edge_row = {"source": source, "target": target}
-        if include_edge_attributes:
-            edge_row.update(edge_data)
-        edges_data.append(edge_row)
-
-    edges_df = pd.DataFrame(edges_data)
+    node_records, edge_records = export_graph_to_records(
+        graph,
+        include_node_attributes=include_node_attributes,
+        include_edge_attributes=include_edge_attributes,
+    )
+
+    nodes_df = pd.DataFrame.from_records(node_records)
+    edges_df = pd.DataFrame.from_records(edge_records)
 
     return nodes_df, edges_df
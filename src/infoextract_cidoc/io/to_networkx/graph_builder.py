@@ -3,15 +3,25 @@ NetworkX graph construction from CIDOC CRM entities.
 
 This module provides utilities to convert CRM entities and relationships
 into NetworkX graphs for social network analysis.
+
+Class and property codes stored on nodes/edges are interned with
+``sys.intern``, so every ``"E21"`` in a graph is the same string object and
+repeated code comparisons short-circuit on identity.
 """
 
+from collections.abc import Iterable, Mapping
+from sys import intern
 from typing import Any
 
 import networkx as nx
 
 from infoextract_cidoc.extraction.models import ExtractionResult
+from infoextract_cidoc.io.to_networkx.attributes import IdStrCache, entity_attributes
 from infoextract_cidoc.models.base import CRMEntity, CRMRelation
 
+# Fields already copied onto every node explicitly
+_CORE_ENTITY_FIELDS = frozenset({"id", "class_code", "label", "notes", "type"})
+
 
 def to_networkx_graph(
     entities: list[CRMEntity],
@@ -42,39 +52,66 @@ def to_networkx_graph(
     else:
         graph = nx.Graph()
 
+    node_ids = IdStrCache()
+
     # Add nodes (entities)
     for entity in entities:
         node_data = {}
         if include_attributes:
             node_data.update(
                 {
-                    "class_code": entity.class_code,
+                    "class_code": intern(entity.class_code),
                     "label": entity.label,
                     "notes": entity.notes,
                     "type": entity.type,
                 }
             )
             # Add any additional attributes
-            node_data.update(
-                {
-                    k: v
-                    for k, v in entity.dict().items()
-                    if k not in ["id", "class_code", "label", "notes", "type"]
-                }
-            )
+            node_data.update(entity_attributes(entity, _CORE_ENTITY_FIELDS))
 
-        graph.add_node(str(entity.id), **node_data)
+        graph.add_node(node_ids[entity.id], **node_data)
 
     # Add edges (relationships)
     if relationships:
         for rel in relationships:
             edge_data = {
-                "property_code": rel.type,
+                "property_code": intern(rel.type),
                 "properties": rel.props or {},
             }
 
-            graph.add_edge(str(rel.src), str(rel.tgt), **edge_data)
+            graph.add_edge(node_ids[rel.src], node_ids[rel.tgt], **edge_data)
+
+    return graph
+
+
+def to_networkx_graph_from_dicts(
+    entities: Iterable[Mapping[str, Any]],
+    *,
+    directed: bool = True,
+) -> nx.Graph:
+    """
+    Build a node-only NetworkX graph straight from serialized entity dicts.
+
+    Skips pydantic validation entirely, so it is only meant for trusted
+    input such as ``canonical_entities.json`` written by this package. Node
+    IDs are the ``id`` strings as given and every other key becomes a node
+    attribute, matching :func:`to_networkx_graph` except that UUID-valued
+    shortcut fields stay strings.
+
+    Args:
+        entities: Entity dicts with at least ``id`` and ``class_code`` keys
+        directed: Whether to create a directed graph
 
+    Returns:
+        NetworkX graph with one node per entity dict
+    """
+    graph = nx.DiGraph() if directed else nx.Graph()
+    for data in entities:
+        node_data: dict[str, Any] = {"label": None, "notes": None, "type": []}
+        node_data.update(data)
+        node_id = node_data.pop("id")
+        node_data["class_code"] = intern(node_data["class_code"])
+        graph.add_node(str(node_id), **node_data)
     return graph
 
 
@@ -101,7 +138,7 @@ def build_graph_from_entities(
     for entity in entities:
         graph.add_node(
             str(entity.id),
-            class_code=entity.class_code,
+            class_code=intern(entity.class_code),
             label=entity.label,
             notes=entity.notes,
             type=entity.type,
@@ -146,14 +183,17 @@ def add_relationships_to_graph(
     Returns:
         Updated NetworkX graph
     """
+    node_ids = IdStrCache()
+
     for rel in relationships:
         edge_data = {
-            "property_code": rel.type,
+            "property_code": intern(rel.type),
             "properties": rel.props or {},
         }
+        source, target = node_ids[rel.src], node_ids[rel.tgt]
 
-        if update_existing or not graph.has_edge(str(rel.src), str(rel.tgt)):
-            graph.add_edge(str(rel.src), str(rel.tgt), **edge_data)
+        if update_existing or not graph.has_edge(source, target):
+            graph.add_edge(source, target, **edge_data)
 
     return graph
 
@@ -245,35 +285,48 @@ def extraction_result_to_networkx(
     """
     graph = nx.DiGraph()
 
-    # Add high-confidence entities as nodes
-    for entity in extraction_result.entities:
-        if entity.confidence >= min_confidence:
-            graph.add_node(
-                str(entity.id),
-                class_code=entity.class_code,
-                label=entity.label,
-                description=entity.description,
-                confidence=entity.confidence,
-                source_text=entity.source_text,
+    # Stringify each admitted id once; the map doubles as the admission set
+    # for relationship endpoints.
+    admitted = [e for e in extraction_result.entities if e.confidence >= min_confidence]
+    node_ids = {entity.id: str(entity.id) for entity in admitted}
+
+    # Add high-confidence entities as nodes; free-form properties are merged
+    # first so they can never shadow the core attributes.
+    graph.add_nodes_from(
+        (
+            node_ids[entity.id],
+            {
                 **entity.properties,
-            )
+                "class_code": intern(entity.class_code),
+                "label": entity.label,
+                "description": entity.description,
+                "confidence": entity.confidence,
+                "source_text": entity.source_text,
+            },
+        )
+        for entity in admitted
+    )
 
     # Add relationships as edges
     if include_relationships:
+        edges = []
         for rel in extraction_result.relationships:
-            if (
-                rel.confidence >= min_confidence
-                and graph.has_node(str(rel.source_id))
-                and graph.has_node(str(rel.target_id))
-            ):
-                graph.add_edge(
-                    str(rel.source_id),
-                    str(rel.target_id),
-                    property_code=rel.property_code,
-                    property_label=rel.property_label,
-                    confidence=rel.confidence,
-                    source_text=rel.source_text,
-                    **rel.properties,
+            source = node_ids.get(rel.source_id)
+            target = node_ids.get(rel.target_id)
+            if source and target and rel.confidence >= min_confidence:
+                edges.append(
+                    (
+                        source,
+                        target,
+                        {
+                            **rel.properties,
+                            "property_code": intern(rel.property_code),
+                            "property_label": rel.property_label,
+                            "confidence": rel.confidence,
+                            "source_text": rel.source_text,
+                        },
+                    )
                 )
+        graph.add_edges_from(edges)
 
     return graph
@@ -7,60 +7,360 @@ Pipeline:
 
 import argparse
 import asyncio
-import json
+import functools
+import hashlib
 import os
-import sys
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from dotenv import load_dotenv
+import orjson
 
+from infoextract_cidoc import __version__
 from infoextract_cidoc.extraction import (
     LangStructExtractor,
+    LiteExtractionResult,
     map_to_crm_entities,
     resolve_extraction,
 )
-from infoextract_cidoc.io.to_cypher import generate_cypher_script
+from infoextract_cidoc.extraction.cache import (
+    ExtractionCache,
+    cached_extract,
+    cached_extract_many,
+    default_cache_dir,
+)
+from infoextract_cidoc.io.to_cypher import write_cypher_script
 from infoextract_cidoc.io.to_markdown import MarkdownStyle, render_table, to_markdown
-from infoextract_cidoc.io.to_networkx import (
-    calculate_centrality_measures,
-    find_communities,
-    to_networkx_graph,
+from infoextract_cidoc.models import ENTITY_LIST_ADAPTER, CRMEntity
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# NetworkX and the matplotlib/pandas-backed visualization package are
+# imported inside the commands that need them, keeping ``--help`` and
+# ``extract`` runs free of their import cost.
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load environment variables from the .env file, once per process.
+
+    Deferred until an LLM is actually needed so that ``--help`` and
+    ``analyze`` never stat or parse ``.env``. Variables already set in the
+    environment take precedence. Setting ``INFOEXTRACT_SKIP_DOTENV`` skips
+    the file entirely, e.g. to keep a developer's keys out of test runs.
+    """
+    if "INFOEXTRACT_SKIP_DOTENV" in os.environ:
+        return
+
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    load_dotenv()
+
+
+_API_KEY_VARS = (
+    "GOOGLE_API_KEY",
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "LANGSTRUCT_DEFAULT_MODEL",
 )
-from infoextract_cidoc.models.base import CRMEntity
-from infoextract_cidoc.visualization import create_network_summary, plot_network_graph
 
-# Load environment variables from .env file
-load_dotenv()
+
+class MissingAPIKeyError(RuntimeError):
+    """Raised when no LLM API key (or default model) is configured."""
+
+
+@functools.cache
+def _configured_api_keys() -> tuple[str, ...]:
+    """Names of the LLM key variables that are set, scanned once per process."""
+    _load_env()
+    return tuple(k for k in _API_KEY_VARS if os.getenv(k))
 
 
 def check_api_key() -> None:
-    """Check that at least one LLM API key is configured."""
-    api_keys = [
-        "GOOGLE_API_KEY",
-        "OPENAI_API_KEY",
-        "ANTHROPIC_API_KEY",
-        "LANGSTRUCT_DEFAULT_MODEL",
+    """Check that at least one LLM API key is configured.
+
+    Raises:
+        MissingAPIKeyError: If none of the supported variables is set.
+    """
+    if not _configured_api_keys():
+        msg = (
+            "No LLM API key configured. Set one of "
+            f"{', '.join(_API_KEY_VARS)} in the environment or a .env file."
+        )
+        raise MissingAPIKeyError(msg)
+
+
+def _filter_by_confidence(
+    lite_result: LiteExtractionResult, threshold: float
+) -> LiteExtractionResult:
+    """Drop entities and relationships below *threshold* before resolution.
+
+    Relationships touching a dropped entity are dropped too, so resolution
+    does not report them as broken links.
+    """
+    if threshold <= 0:
+        return lite_result
+    # Plain comprehensions on purpose: reading .confidence off each model
+    # dominates, so a NumPy mask (np.fromiter + flatnonzero) measured ~1.8x
+    # slower than this even at 5k entities.
+    entities = [e for e in lite_result.entities if e.confidence >= threshold]
+    kept_refs = {e.ref_id for e in entities}
+    relationships = [
+        r
+        for r in lite_result.relationships
+        if r.confidence >= threshold
+        and r.source_ref in kept_refs
+        and r.target_ref in kept_refs
     ]
-    configured = [k for k in api_keys if os.getenv(k)]
-    if not configured:
-        for _key in api_keys[:3]:
-            pass
-        sys.exit(1)
+    if len(entities) == len(lite_result.entities) and len(relationships) == len(
+        lite_result.relationships
+    ):
+        return lite_result  # Nothing dropped: no copy needed
+    return lite_result.model_copy(
+        update={"entities": entities, "relationships": relationships}
+    )
 
 
-async def _run_extraction(text: str) -> tuple:
-    """Run the full extraction pipeline on text.
+def _resolve_and_map(
+    lite_result: LiteExtractionResult, confidence_threshold: float = 0.0
+) -> tuple:
+    """Resolve a LangStruct result and map it onto CRM entities.
+
+    Args:
+        lite_result: Raw LangStruct extraction output
+        confidence_threshold: Minimum confidence for entities/relationships
 
     Returns:
         Tuple of (lite_result, extraction_result, crm_entities, crm_relations)
     """
-    extractor = LangStructExtractor()
-    lite_result = await extractor.extract_async(text)
-    extraction_result = resolve_extraction(lite_result)
+    extraction_result = resolve_extraction(
+        _filter_by_confidence(lite_result, confidence_threshold)
+    )
     crm_entities, crm_relations = map_to_crm_entities(extraction_result)
     return lite_result, extraction_result, crm_entities, crm_relations
 
 
+async def _run_extraction(
+    text: str,
+    *,
+    confidence_threshold: float = 0.0,
+    use_cache: bool = True,
+    cache_dir: Path | None = None,
+) -> tuple:
+    """Run the full extraction pipeline on text.
+
+    Args:
+        text: Input text to extract from
+        confidence_threshold: Minimum confidence for entities/relationships
+        use_cache: Serve repeat extractions from the on-disk cache
+        cache_dir: Extraction cache directory (defaults to the user cache)
+
+    Returns:
+        Tuple of (lite_result, extraction_result, crm_entities, crm_relations)
+    """
+    _load_env()
+    extractor = LangStructExtractor()
+    if use_cache:
+        lite_result = await cached_extract(
+            extractor, text, cache=ExtractionCache(cache_dir)
+        )
+    else:
+        lite_result = await extractor.extract_async(text)
+    return _resolve_and_map(lite_result, confidence_threshold)
+
+
+async def _run_extraction_batch(
+    texts: list[str],
+    *,
+    confidence_threshold: float = 0.0,
+    max_workers: int | None = None,
+    use_cache: bool = True,
+    cache_dir: Path | None = None,
+) -> list[tuple | BaseException]:
+    """Run the full extraction pipeline on many texts with one batched LLM call.
+
+    Args:
+        texts: Input texts to extract from
+        confidence_threshold: Minimum confidence for entities/relationships
+        max_workers: Maximum number of concurrent LLM requests
+        use_cache: Serve repeat extractions from the on-disk cache
+        cache_dir: Extraction cache directory (defaults to the user cache)
+
+    Returns:
+        One (lite_result, extraction_result, crm_entities, crm_relations)
+        tuple per input text, in input order; a document whose resolution
+        failed gets its exception instead
+    """
+    _load_env()
+    extractor = LangStructExtractor()
+    if use_cache:
+        lite_results = await cached_extract_many(
+            extractor,
+            texts,
+            cache=ExtractionCache(cache_dir),
+            max_workers=max_workers,
+        )
+    else:
+        lite_results = await extractor.extract_many_async(
+            texts, max_workers=max_workers
+        )
+    return await asyncio.gather(
+        *(
+            asyncio.to_thread(_resolve_and_map, lite, confidence_threshold)
+            for lite in lite_results
+        ),
+        return_exceptions=True,
+    )
+
+
+def _expand_input_files(spec: str) -> list[Path]:
+    """Expand a directory or glob pattern into a sorted list of input files."""
+    path = Path(spec)
+    if path.is_dir():
+        candidates = path.iterdir()
+    elif path.is_absolute():
+        candidates = Path(path.anchor).glob(str(path.relative_to(path.anchor)))
+    else:
+        candidates = Path().glob(spec)
+    return sorted(p for p in candidates if p.is_file())
+
+
+def _output_dirs(paths: list[Path], output_root: Path) -> list[Path]:
+    """Output directory for each input file, distinct even when stems repeat.
+
+    Each file normally writes to ``output_root / <file stem>``. If two inputs
+    share a stem (``a.txt`` and ``a.md``, or ``x/bio.txt`` and ``y/bio.txt``),
+    every file instead uses its path relative to the inputs' common parent,
+    extension included, so no two documents write into the same directory.
+    """
+    stems = [path.stem for path in paths]
+    if len(set(stems)) == len(stems):
+        return [output_root / stem for stem in stems]
+    common = Path(os.path.commonpath([path.parent for path in paths]))
+    return [output_root / path.relative_to(common) for path in paths]
+
+
+async def _run_many(
+    paths: list[Path],
+    output_root: Path,
+    write_outputs: Callable[[str, tuple, Path], Awaitable[None]],
+    *,
+    max_concurrency: int,
+    confidence_threshold: float = 0.0,
+    use_cache: bool = True,
+    cache_dir: Path | None = None,
+) -> None:
+    """Extract many input files in one batch and write their outputs.
+
+    All documents go to the LLM as a single LangStruct batch with at most
+    *max_concurrency* requests in flight. If that batch fails, each document
+    is retried on its own so one bad document does not cost the others their
+    outputs. Each document then writes into its own directory under
+    *output_root* (see :func:`_output_dirs`).
+
+    Raises:
+        ExceptionGroup: If any document failed; the others still complete.
+        BaseException: A non-``Exception`` error such as ``CancelledError``
+            from any document is re-raised directly.
+    """
+    reads = await asyncio.gather(
+        *(asyncio.to_thread(path.read_text, encoding="utf-8") for path in paths),
+        return_exceptions=True,
+    )
+    # Unreadable files stay out of the LLM batch and fail on their own
+    texts = [read for read in reads if isinstance(read, str)]
+    extractions: list[tuple | BaseException]
+    try:
+        extractions = await _run_extraction_batch(
+            texts,
+            confidence_threshold=confidence_threshold,
+            max_workers=max_concurrency,
+            use_cache=use_cache,
+            cache_dir=cache_dir,
+        )
+    except Exception:  # noqa: BLE001
+        # LangStruct fails the whole batch on any one bad document, whatever
+        # the error type; the per-document retry surfaces the real failures
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract_one(text: str) -> tuple:
+            async with semaphore:
+                return await _run_extraction(
+                    text,
+                    confidence_threshold=confidence_threshold,
+                    use_cache=use_cache,
+                    cache_dir=cache_dir,
+                )
+
+        extractions = await asyncio.gather(
+            *(extract_one(text) for text in texts), return_exceptions=True
+        )
+
+    # Line the extractions back up with the paths, read errors included
+    extracted = zip(texts, extractions, strict=True)
+    documents: list[tuple[str, tuple | BaseException] | BaseException] = [
+        read if isinstance(read, BaseException) else next(extracted) for read in reads
+    ]
+
+    async def write_one(
+        output_dir: Path, document: tuple[str, tuple | BaseException] | BaseException
+    ) -> None:
+        if isinstance(document, BaseException):
+            raise document
+        text, extraction = document
+        if isinstance(extraction, BaseException):
+            raise extraction
+        await write_outputs(text, extraction, output_dir)
+
+    results = await asyncio.gather(
+        *(
+            write_one(output_dir, document)
+            for output_dir, document in zip(
+                _output_dirs(paths, output_root), documents, strict=True
+            )
+        ),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    # Cancellation and other non-Exception errors abort the run as they are
+    # rather than being counted as document failures
+    for error in errors:
+        if not isinstance(error, Exception):
+            raise error
+    failures = [error for error in errors if isinstance(error, Exception)]
+    if failures:
+        msg = f"{len(failures)} of {len(paths)} documents failed"
+        raise ExceptionGroup(msg, failures)
+
+
+def _json_indent(*, pretty: bool) -> int | None:
+    """Indent for JSON outputs: compact unless ``--pretty`` was given."""
+    return 2 if pretty else None
+
+
+def _dump_crm_entities(crm_entities: list[CRMEntity], *, pretty: bool) -> bytes:
+    """Serialize CRM entities (including subclass fields) in one pydantic pass."""
+    return ENTITY_LIST_ADAPTER.dump_json(
+        crm_entities, indent=_json_indent(pretty=pretty), serialize_as_any=True
+    )
+
+
+async def _write_files(files: dict[Path, str | bytes]) -> None:
+    """Write every file concurrently on the default thread pool.
+
+    Keeps disk I/O off the event loop so concurrent extractions are not
+    stalled behind output writes. Text is written as UTF-8.
+    """
+
+    def write(path: Path, content: str | bytes) -> None:
+        path.write_bytes(content.encode() if isinstance(content, str) else content)
+
+    await asyncio.gather(
+        *(asyncio.to_thread(write, path, content) for path, content in files.items())
+    )
+
+
 async def complete_workflow_demo(
     text: str,
     output_dir: str = "output",
@@ -68,6 +368,10 @@ async def complete_workflow_demo(
     interactive: bool = True,
     export_cypher: bool = True,
     confidence_threshold: float = 0.5,
+    *,
+    use_cache: bool = True,
+    cache_dir: Path | None = None,
+    pretty: bool = False,
 ) -> None:
     """Run the complete infoextract-cidoc workflow.
 
@@ -78,170 +382,313 @@ async def complete_workflow_demo(
         interactive: Whether to create interactive plots (currently static only)
         export_cypher: Whether to export Cypher scripts
         confidence_threshold: Minimum confidence for entities/relationships
+        use_cache: Serve repeat extractions from the on-disk cache
+        cache_dir: Extraction cache directory (defaults to the user cache)
+        pretty: Indent the JSON outputs for human reading
     """
 
     # Step 1: LangStruct extraction + resolution + CRM mapping
+    extraction = await _run_extraction(
+        text,
+        confidence_threshold=confidence_threshold,
+        use_cache=use_cache,
+        cache_dir=cache_dir,
+    )
+
+    await _write_workflow_outputs(
+        text,
+        extraction,
+        Path(output_dir),
+        visualize=visualize,
+        interactive=interactive,
+        export_cypher=export_cypher,
+        pretty=pretty,
+    )
 
+
+async def _write_workflow_outputs(
+    text: str,
+    extraction: tuple,
+    output_path: Path,
+    *,
+    visualize: bool,
+    interactive: bool,
+    export_cypher: bool,
+    pretty: bool = False,
+) -> None:
+    """Write every workflow output for one already-extracted document."""
     (
         _lite_result,
-        extraction_result,
+        _extraction_result,
         crm_entities,
         crm_relations,
-    ) = await _run_extraction(text)
-
-    # Apply confidence threshold filter
-    crm_entities = [
-        e
-        for e in crm_entities
-        if not hasattr(e, "confidence") or True  # CRMEntity doesn't have confidence
-    ]
-    # Filter at the extraction_result level
-    [e for e in extraction_result.entities if e.confidence >= confidence_threshold]
-
-    # Step 2: Serialize as Canonical JSON
+    ) = extraction
 
-    output_path = Path(output_dir)
-    output_path.mkdir(exist_ok=True)
-
-    json_data = [entity.model_dump(mode="json") for entity in crm_entities]
+    output_path.mkdir(parents=True, exist_ok=True)
     json_file = output_path / "canonical_entities.json"
-    with json_file.open("w") as f:
-        json.dump(json_data, f, indent=2)
-
-    # Step 3: Render to Markdown
-
     markdown_dir = output_path / "markdown"
     markdown_dir.mkdir(exist_ok=True)
 
-    for i, entity in enumerate(crm_entities[:5]):
-        markdown_card = to_markdown(entity, MarkdownStyle.CARD)
-        card_file = markdown_dir / f"entity_{i + 1}_{entity.class_code}.md"
-        with card_file.open("w") as f:
-            f.write(markdown_card)
-
-    table_markdown = render_table(crm_entities)
-    table_file = markdown_dir / "entities_summary.md"
-    with table_file.open("w") as f:
-        f.write("# CRM Entities Summary\n\n" + table_markdown)
+    def render_documents() -> dict[Path, str | bytes]:
+        # Step 2: Serialize as Canonical JSON
+        documents: dict[Path, str | bytes] = {
+            json_file: _dump_crm_entities(crm_entities, pretty=pretty)
+        }
 
-    # Step 4: Convert to NetworkX Graph
+        # Step 3: Render to Markdown
+        for i, entity in enumerate(crm_entities[:5]):
+            card_file = markdown_dir / f"entity_{i + 1}_{entity.class_code}.md"
+            documents[card_file] = to_markdown(entity, MarkdownStyle.CARD)
 
-    graph = to_networkx_graph(crm_entities)
+        documents[markdown_dir / "entities_summary.md"] = (
+            "# CRM Entities Summary\n\n" + render_table(crm_entities)
+        )
+        return documents
 
-    # Step 5: Network Analysis
+    # Steps 2-7 all run on the thread pool: JSON/Markdown rendering and the
+    # Cypher export only need the entities, while the graph is built once and
+    # then shared by the analyses and the plot, which only read it.
 
-    calculate_centrality_measures(graph)
-    communities = find_communities(graph)
-    network_stats = create_network_summary(graph)
+    from infoextract_cidoc.io.to_networkx import (  # noqa: PLC0415
+        calculate_centrality_measures,
+        find_communities,
+        to_networkx_graph,
+    )
+    from infoextract_cidoc.visualization.export import (  # noqa: PLC0415
+        create_network_summary,
+    )
 
-    # Step 6: Visualization
     if visualize or interactive:
         plots_dir = output_path / "plots"
         plots_dir.mkdir(exist_ok=True)
 
+    async def analyse_graph() -> tuple["nx.Graph", list[list[str]], dict[str, Any]]:
+        # Step 4: Convert to NetworkX Graph
+        graph = await asyncio.to_thread(to_networkx_graph, crm_entities)
+
+        # Step 5: Network Analysis + Step 6: Visualization
+        plot: Awaitable[object]
         if visualize:
-            plot_network_graph(
+            from infoextract_cidoc.visualization import (  # noqa: PLC0415
+                plot_network_graph,
+            )
+
+            plot = asyncio.to_thread(
+                plot_network_graph,
                 graph,
                 title="infoextract-cidoc Network Analysis",
                 figsize=(14, 10),
                 show_plot=False,
                 save_path=str(plots_dir / "network_overview.png"),
             )
+        else:
+            plot = asyncio.sleep(0)
+
+        _centrality, communities, network_stats, _figure = await asyncio.gather(
+            asyncio.to_thread(calculate_centrality_measures, graph),
+            asyncio.to_thread(find_communities, graph),
+            asyncio.to_thread(create_network_summary, graph),
+            plot,
+        )
+        return graph, communities, network_stats
 
-    # Step 7: Export to Cypher
-    if export_cypher:
-        cypher_script = generate_cypher_script(crm_entities)
-        cypher_file = output_path / "network.cypher"
-        with cypher_file.open("w") as f:
-            f.write(cypher_script)
+    # Step 7: Export to Cypher, streamed straight to disk
+    cypher: Awaitable[None] = (
+        asyncio.to_thread(
+            write_cypher_script, crm_entities, output_path / "network.cypher"
+        )
+        if export_cypher
+        else asyncio.sleep(0)
+    )
+
+    files, (graph, communities, network_stats), _ = await asyncio.gather(
+        asyncio.to_thread(render_documents), analyse_graph(), cypher
+    )
 
     # Step 8: Create Summary Report
 
-    summary_file = output_path / "workflow_summary.md"
-    with summary_file.open("w") as f:
-        f.write("# infoextract-cidoc Workflow Summary\n\n")
-        f.write(f"## Input Text\n\n{text[:200]}...\n\n")
-        f.write("## Extracted Entities\n\n")
-        f.write(f"- Total entities: {len(crm_entities)}\n")
-        f.write(f"- Total relations: {len(crm_relations)}\n\n")
-        f.write("## Network Analysis\n\n")
-        f.write(f"- Nodes: {graph.number_of_nodes()}\n")
-        f.write(f"- Edges: {graph.number_of_edges()}\n")
-        f.write(f"- Density: {network_stats['network_info']['density']:.3f}\n")
-        f.write(f"- Communities: {len(communities)}\n\n")
-        f.write("## Output Files\n\n")
-        f.write(f"- Canonical JSON: {json_file}\n")
-        f.write(f"- Markdown reports: {markdown_dir}\n")
-        if visualize or interactive:
-            f.write(f"- Network plots: {output_path / 'plots'}\n")
-        if export_cypher:
-            f.write(f"- Cypher script: {output_path / 'network.cypher'}\n")
-
-
-async def einstein_demo() -> None:
+    summary: list[str] = [
+        "# infoextract-cidoc Workflow Summary\n\n",
+        f"## Input Text\n\n{text[:200]}...\n\n",
+        "## Extracted Entities\n\n",
+        f"- Total entities: {len(crm_entities)}\n",
+        f"- Total relations: {len(crm_relations)}\n\n",
+        "## Network Analysis\n\n",
+        f"- Nodes: {graph.number_of_nodes()}\n",
+        f"- Edges: {graph.number_of_edges()}\n",
+        f"- Density: {network_stats['network_info']['density']:.3f}\n",
+        f"- Communities: {len(communities)}\n\n",
+        "## Output Files\n\n",
+        f"- Canonical JSON: {json_file}\n",
+        f"- Markdown reports: {markdown_dir}\n",
+    ]
+    if visualize or interactive:
+        summary.append(f"- Network plots: {output_path / 'plots'}\n")
+    if export_cypher:
+        summary.append(f"- Cypher script: {output_path / 'network.cypher'}\n")
+    files[output_path / "workflow_summary.md"] = "".join(summary)
+
+    await _write_files(files)
+
+
+async def einstein_demo(
+    *, use_cache: bool = True, cache_dir: Path | None = None
+) -> None:
     """Run the Einstein biography demo."""
 
     einstein_file = Path("src/infoextract_cidoc/examples/einstein.md")
     if not einstein_file.exists():
         return
 
-    with einstein_file.open() as f:
-        einstein_text = f.read()
-
-    await complete_workflow_demo(einstein_text, "einstein_output")
+    einstein_text = einstein_file.read_text(encoding="utf-8")
 
+    await complete_workflow_demo(
+        einstein_text, "einstein_output", use_cache=use_cache, cache_dir=cache_dir
+    )
 
-async def handle_extract_command(args: argparse.Namespace) -> None:
-    """Handle the extract command."""
-    if not args.text and not args.file:
-        return
-
-    if args.text and args.file:
-        return
 
+def _read_single_input(args: argparse.Namespace) -> str | None:
+    """Return the text given via ``--text``/``--file``, or None if unusable."""
     if args.file:
         file_path = Path(args.file)
         if not file_path.exists():
-            return
-        with file_path.open() as f:
-            text = f.read()
-    else:
-        text = args.text
+            return None
+        return file_path.read_text(encoding="utf-8")
+    return str(args.text)
+
+
+def _has_single_input_source(args: argparse.Namespace) -> bool:
+    """Whether exactly one of ``--text``, ``--file`` and ``--files`` is given."""
+    return sum(bool(source) for source in (args.text, args.file, args.files)) == 1
+
 
+async def _write_extraction_outputs(
+    extraction: tuple,
+    output_dir: Path,
+    *,
+    output_format: str,
+    pretty: bool = False,
+) -> None:
+    """Write the extract command outputs for one already-extracted document."""
     (
         _lite_result,
         extraction_result,
         crm_entities,
         _crm_relations,
-    ) = await _run_extraction(text)
+    ) = extraction
 
-    # Apply confidence filter
-    filtered_entities = [
-        e for e in extraction_result.entities if e.confidence >= args.confidence
-    ]
-    filtered_relationships = [
-        r for r in extraction_result.relationships if r.confidence >= args.confidence
-    ]
+    output_dir.mkdir(parents=True, exist_ok=True)
+    files: dict[Path, str | bytes] = {}
 
-    output_dir = Path(args.output)
-    output_dir.mkdir(exist_ok=True)
+    if output_format in ["json", "both"]:
+        files[output_dir / "extraction_result.json"] = (
+            extraction_result.model_dump_json(
+                indent=_json_indent(pretty=pretty),
+                exclude={"extraction_metadata"},
+                serialize_as_any=True,
+            )
+        )
+        files[output_dir / "canonical_entities.json"] = _dump_crm_entities(
+            crm_entities, pretty=pretty
+        )
 
-    if args.format in ["json", "both"]:
-        result_data = {
-            "entities": [e.model_dump() for e in filtered_entities],
-            "relationships": [r.model_dump() for r in filtered_relationships],
-        }
-        with (output_dir / "extraction_result.json").open("w") as f:
-            json.dump(result_data, f, indent=2)
+    if output_format in ["markdown", "both"]:
+        files[output_dir / "extraction_result.md"] = render_table(crm_entities)
 
-        canonical_json = [entity.model_dump(mode="json") for entity in crm_entities]
-        with (output_dir / "canonical_entities.json").open("w") as f:
-            json.dump(canonical_json, f, indent=2)
+    await _write_files(files)
 
-    if args.format in ["markdown", "both"]:
-        markdown_content = render_table(crm_entities)
-        with (output_dir / "extraction_result.md").open("w") as f:
-            f.write(markdown_content)
+
+async def handle_extract_command(args: argparse.Namespace) -> None:
+    """Handle the extract command."""
+    if not _has_single_input_source(args):
+        return
+
+    async def write_outputs(_text: str, extraction: tuple, output_dir: Path) -> None:
+        await _write_extraction_outputs(
+            extraction,
+            output_dir,
+            output_format=args.format,
+            pretty=args.pretty,
+        )
+
+    if args.files:
+        await _run_many(
+            _expand_input_files(args.files),
+            Path(args.output),
+            write_outputs,
+            max_concurrency=args.max_concurrency,
+            confidence_threshold=args.confidence,
+            use_cache=not args.no_cache,
+            cache_dir=args.cache_dir,
+        )
+        return
+
+    text = _read_single_input(args)
+    if text is None:
+        return
+
+    extraction = await _run_extraction(
+        text,
+        confidence_threshold=args.confidence,
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
+    )
+    await write_outputs(text, extraction, Path(args.output))
+
+
+def _analysis_cache_dir(
+    input_bytes: bytes, cache_dir: Path | None = None, *, validate: bool = True
+) -> Path:
+    """Cache directory for analyses of one input file's exact contents.
+
+    Validated and ``--no-validate`` runs key their graphs differently (uuid5
+    node ids vs. the raw input ids), so each mode gets its own entries.
+    """
+    digest = hashlib.blake2b(input_bytes, digest_size=16)
+    digest.update(__version__.encode())
+    digest.update(b"validated" if validate else b"raw")
+    return (cache_dir or default_cache_dir()) / "analysis" / digest.hexdigest()
+
+
+def _load_or_compute(path: Path | None, compute: Callable[[], Any]) -> Any:
+    """Return the JSON result cached at *path*, computing and storing it on a miss.
+
+    With *path* None the result is always computed and nothing is stored.
+    """
+    if path is not None:
+        try:
+            return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            pass  # Missing or unreadable entry: recompute and overwrite it
+
+    result = compute()
+    if path is not None:
+        # Write atomically so a concurrent run never reads a partial entry
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(result))
+        tmp_path.replace(path)
+    return result
+
+
+def _analysis_entity_dicts(data: Any) -> list[dict[str, Any]] | None:
+    """Entity dicts from either analyze input layout, or None if unrecognised."""
+    if isinstance(data, list):
+        # Canonical JSON (canonical_entities.json)
+        return data
+    if isinstance(data, dict) and "entities" in data:
+        # Extraction result (extraction_result.json)
+        return [
+            {
+                "id": entity_data["id"],
+                "class_code": entity_data["class_code"],
+                "label": entity_data["label"],
+                "notes": entity_data.get("description", ""),
+                "source_text": entity_data.get("source_text"),
+            }
+            for entity_data in data["entities"]
+        ]
+    return None
 
 
 async def handle_analyze_command(args: argparse.Namespace) -> None:
@@ -250,93 +697,135 @@ async def handle_analyze_command(args: argparse.Namespace) -> None:
     if not input_file.exists():
         return
 
-    with input_file.open() as f:
-        data = json.load(f)
+    input_bytes = input_file.read_bytes()
+    entity_dicts = _analysis_entity_dicts(orjson.loads(input_bytes))
+    if entity_dicts is None:
+        return
 
-    entities = []
+    # Both layouts are validated in a single pass over the whole list; with
+    # --no-validate that pass only happens if the Cypher export needs models.
+    @functools.cache
+    def entities() -> list[CRMEntity]:
+        return ENTITY_LIST_ADAPTER.validate_python(entity_dicts)
 
-    if isinstance(data, list):
-        for entity_data in data:
-            entity = CRMEntity(**entity_data)
-            entities.append(entity)
-    elif isinstance(data, dict) and "entities" in data:
-        for entity_data in data["entities"]:
-            entity = CRMEntity(
-                id=entity_data["id"],
-                class_code=entity_data["class_code"],
-                label=entity_data["label"],
-                notes=entity_data.get("description", ""),
-                source_text=entity_data.get("source_text"),
-            )
-            entities.append(entity)
-    else:
-        return
+    if not args.no_validate:
+        entities()
+
+    from infoextract_cidoc.io.to_networkx import (  # noqa: PLC0415
+        calculate_centrality_measures,
+        find_communities,
+        to_networkx_graph,
+        to_networkx_graph_from_dicts,
+    )
 
     output_dir = Path(args.output)
     output_dir.mkdir(exist_ok=True)
 
-    graph = to_networkx_graph(entities)
+    # Centrality and communities of an unchanged input are reused from the
+    # cache; the graph is only built when something actually needs it.
+    cache_dir = (
+        None
+        if args.no_cache
+        else _analysis_cache_dir(
+            input_bytes, args.cache_dir, validate=not args.no_validate
+        )
+    )
+
+    @functools.cache
+    def graph() -> "nx.Graph":
+        return (
+            to_networkx_graph_from_dicts(entity_dicts)
+            if args.no_validate
+            else to_networkx_graph(entities())
+        )
+
+    json_option = orjson.OPT_INDENT_2 if args.pretty else 0
 
     if args.centrality:
-        centrality_measures = calculate_centrality_measures(graph)
-        with (output_dir / "centrality_measures.json").open("w") as f:
-            json.dump(centrality_measures, f, indent=2)
+        centrality_measures = _load_or_compute(
+            cache_dir and cache_dir / "centrality.json",
+            lambda: calculate_centrality_measures(graph()),
+        )
+        (output_dir / "centrality_measures.json").write_bytes(
+            orjson.dumps(centrality_measures, option=json_option)
+        )
 
     if args.communities:
-        communities = find_communities(graph)
+        communities = _load_or_compute(
+            cache_dir and cache_dir / "communities.json",
+            lambda: find_communities(graph()),
+        )
         community_data = {
             "num_communities": len(communities),
             "communities": [list(community) for community in communities],
         }
-        with (output_dir / "communities.json").open("w") as f:
-            json.dump(community_data, f, indent=2)
+        (output_dir / "communities.json").write_bytes(
+            orjson.dumps(community_data, option=json_option)
+        )
 
     if args.visualize:
+        from infoextract_cidoc.visualization import (  # noqa: PLC0415
+            plot_network_graph,
+        )
+
         plot_network_graph(
-            graph,
+            graph(),
             title="CRM Entity Network",
             save_path=str(output_dir / "network_plot.png"),
             show_plot=False,
         )
 
     if args.export_cypher:
-        cypher_script = generate_cypher_script(entities)
-        with (output_dir / "entities.cypher").open("w") as f:
-            f.write(cypher_script)
+        write_cypher_script(entities(), output_dir / "entities.cypher")
 
 
 async def handle_workflow_command(args: argparse.Namespace) -> None:
     """Handle the workflow command."""
-    if not args.text and not args.file:
+    if not _has_single_input_source(args):
         return
 
-    if args.text and args.file:
+    run_all = args.all
+
+    async def write_outputs(text: str, extraction: tuple, output_dir: Path) -> None:
+        await _write_workflow_outputs(
+            text,
+            extraction,
+            output_dir,
+            visualize=args.visualize or run_all,
+            interactive=args.interactive or run_all,
+            export_cypher=args.export_cypher or run_all,
+            pretty=args.pretty,
+        )
+
+    if args.files:
+        await _run_many(
+            _expand_input_files(args.files),
+            Path(args.output),
+            write_outputs,
+            max_concurrency=args.max_concurrency,
+            confidence_threshold=args.confidence,
+            use_cache=not args.no_cache,
+            cache_dir=args.cache_dir,
+        )
         return
 
-    if args.file:
-        file_path = Path(args.file)
-        if not file_path.exists():
-            return
-        with file_path.open() as f:
-            text = f.read()
-    else:
-        text = args.text
+    text = _read_single_input(args)
+    if text is None:
+        return
 
-    run_all = args.all
-    await complete_workflow_demo(
+    extraction = await _run_extraction(
         text,
-        args.output,
-        visualize=args.visualize or run_all,
-        interactive=args.interactive or run_all,
-        export_cypher=args.export_cypher or run_all,
         confidence_threshold=args.confidence,
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
     )
+    await write_outputs(text, extraction, Path(args.output))
 
 
 async def handle_demo_command(args: argparse.Namespace) -> None:
     """Handle the demo command."""
     if args.einstein:
-        await einstein_demo()
+        await einstein_demo(use_cache=not args.no_cache, cache_dir=args.cache_dir)
     elif args.sample:
         sample_text = (
             "Albert Einstein was born on March 14, 1879, in Ulm, Germany. "
@@ -344,7 +833,12 @@ async def handle_demo_command(args: argparse.Namespace) -> None:
             "Einstein worked at the Institute for Advanced Study in Princeton, New Jersey. "
             "He died on April 18, 1955, at Princeton Hospital."
         )
-        await complete_workflow_demo(sample_text, args.output)
+        await complete_workflow_demo(
+            sample_text,
+            args.output,
+            use_cache=not args.no_cache,
+            cache_dir=args.cache_dir,
+        )
     else:
         pass
 
@@ -358,6 +852,7 @@ async def main() -> None:
 Examples:
   infoextract-cidoc extract --text "Albert Einstein was born in Ulm, Germany"
   infoextract-cidoc extract --file biography.txt --output results/
+  infoextract-cidoc extract --files "biographies/*.txt" --max-concurrency 4
   infoextract-cidoc analyze --input entities.json --visualize --export-cypher
   infoextract-cidoc workflow --file biography.txt --all --output results/
         """,
@@ -369,10 +864,32 @@ Examples:
     extract_parser = subparsers.add_parser(
         "extract", help="Extract entities from text using AI"
     )
+    extract_parser.set_defaults(handler=handle_extract_command, needs_api_key=True)
     extract_parser.add_argument("--text", help="Text to extract entities from")
     extract_parser.add_argument(
         "--file", help="File containing text to extract entities from"
     )
+    extract_parser.add_argument(
+        "--files",
+        help="Directory or glob pattern of text files to process as a batch "
+        "(one output subdirectory per file)",
+    )
+    extract_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent LLM requests with --files",
+    )
+    extract_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM instead of reusing cached extractions",
+    )
+    extract_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Cache directory (default: $XDG_CACHE_HOME/infoextract-cidoc)",
+    )
     extract_parser.add_argument(
         "--output", "-o", default="output", help="Output directory"
     )
@@ -385,9 +902,15 @@ Examples:
         default="both",
         help="Output format",
     )
+    extract_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON outputs (compact by default)",
+    )
 
     # Analyze command
     analyze_parser = subparsers.add_parser("analyze", help="Analyze extracted entities")
+    analyze_parser.set_defaults(handler=handle_analyze_command, needs_api_key=False)
     analyze_parser.add_argument(
         "--input", "-i", required=True, help="Input file with extracted entities"
     )
@@ -409,11 +932,54 @@ Examples:
     analyze_parser.add_argument(
         "--communities", action="store_true", help="Find communities"
     )
+    analyze_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute centrality and communities instead of reusing cached results",
+    )
+    analyze_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Cache directory (default: $XDG_CACHE_HOME/infoextract-cidoc)",
+    )
+    analyze_parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Build the graph straight from the JSON without model validation "
+        "(trusted canonical output only)",
+    )
+    analyze_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON outputs (compact by default)",
+    )
 
     # Workflow command (complete pipeline)
     workflow_parser = subparsers.add_parser("workflow", help="Run complete workflow")
+    workflow_parser.set_defaults(handler=handle_workflow_command, needs_api_key=True)
     workflow_parser.add_argument("--text", help="Text to process")
     workflow_parser.add_argument("--file", help="File containing text to process")
+    workflow_parser.add_argument(
+        "--files",
+        help="Directory or glob pattern of text files to process as a batch "
+        "(one output subdirectory per file)",
+    )
+    workflow_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent LLM requests with --files",
+    )
+    workflow_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM instead of reusing cached extractions",
+    )
+    workflow_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Cache directory (default: $XDG_CACHE_HOME/infoextract-cidoc)",
+    )
     workflow_parser.add_argument(
         "--output", "-o", default="workflow_output", help="Output directory"
     )
@@ -432,15 +998,31 @@ Examples:
     workflow_parser.add_argument(
         "--confidence", type=float, default=0.5, help="Minimum confidence threshold"
     )
+    workflow_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON outputs (compact by default)",
+    )
 
     # Demo commands
     demo_parser = subparsers.add_parser("demo", help="Run demo examples")
+    demo_parser.set_defaults(handler=handle_demo_command, needs_api_key=True)
     demo_parser.add_argument(
         "--einstein", action="store_true", help="Run Einstein biography demo"
     )
     demo_parser.add_argument(
         "--sample", action="store_true", help="Run sample text demo"
     )
+    demo_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM instead of reusing cached extractions",
+    )
+    demo_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Cache directory (default: $XDG_CACHE_HOME/infoextract-cidoc)",
+    )
     demo_parser.add_argument(
         "--output", "-o", default="demo_output", help="Output directory"
     )
@@ -452,22 +1034,26 @@ Examples:
         return
 
     # Check API key for commands that need LLM
-    if args.command in ["extract", "workflow", "demo"]:
-        check_api_key()
+    if args.needs_api_key:
+        try:
+            check_api_key()
+        except MissingAPIKeyError as e:
+            parser.exit(1, f"error: {e}\n")
 
-    if args.command == "extract":
-        await handle_extract_command(args)
-    elif args.command == "analyze":
-        await handle_analyze_command(args)
-    elif args.command == "workflow":
-        await handle_workflow_command(args)
-    elif args.command == "demo":
-        await handle_demo_command(args)
+    await args.handler(args)
 
 
 def cli() -> None:
-    """Command line interface entry point."""
-    asyncio.run(main())
+    """Command line interface entry point.
+
+    Runs on uvloop when the optional ``speedups`` extra is installed.
+    """
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
 
 if __name__ == "__main__":
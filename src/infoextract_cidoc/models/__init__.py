@@ -1,6 +1,11 @@
 """CRM models package for COLLIE."""
 
 from .base import (
+    CLASS_BY_CODE,
+    ENTITY_LIST_ADAPTER,
+    PROPERTY_FIELDS,
+    SUBCLASS_CODES,
+    AnyCRMEntity,
     CRMEntity,
     CRMRelation,
     E5_Event,
@@ -17,6 +22,11 @@ from .base import (
 )
 
 __all__ = [
+    "CLASS_BY_CODE",
+    "ENTITY_LIST_ADAPTER",
+    "PROPERTY_FIELDS",
+    "SUBCLASS_CODES",
+    "AnyCRMEntity",
     "CRMEntity",
     "CRMRelation",
     "E5_Event",
@@ -3,11 +3,36 @@ Base CRM entity model and core wrappers.
 Provides the foundation for all CIDOC CRM E-class models.
 """
 
-import hashlib
-from typing import Any
-from uuid import UUID, uuid4
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+import sys
+from functools import lru_cache
+from typing import Annotated, Any
+from uuid import UUID, uuid4, uuid5
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    JsonValue,
+    Tag,
+    TypeAdapter,
+    field_validator,
+)
+
+# Namespace for deterministic UUIDs derived from non-UUID string IDs
+_ID_NAMESPACE = UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
+
+
+@lru_cache(maxsize=8192)
+def _name_uuid(value: str) -> UUID:
+    """Parse *value* as a UUID, or derive a stable UUID5 from it.
+
+    Cached because the same IDs recur across entity and relation payloads.
+    """
+    try:
+        return UUID(value)
+    except ValueError:
+        return uuid5(_ID_NAMESPACE, value)
 
 
 class CRMEntity(BaseModel):
@@ -22,7 +47,10 @@ class CRMEntity(BaseModel):
     - type: list of type assignments
     """
 
+    # Subclasses inherit defer_build, so each E-class builds its validator on
+    # first use rather than at import (most processes touch only a few)
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "description": "Base CIDOC CRM entity",
             "examples": [
@@ -33,7 +61,7 @@ class CRMEntity(BaseModel):
                     "type": ["E55:Vessel", "E55:Ceramic"],
                 }
             ],
-        }
+        },
     )
 
     id: UUID = Field(
@@ -53,20 +81,15 @@ class CRMEntity(BaseModel):
     def convert_string_to_uuid(cls, v: Any) -> Any:
         """Convert string IDs to UUIDs for backward compatibility."""
         if isinstance(v, str):
-            try:
-                return UUID(v)
-            except ValueError:
-                # If string is not a valid UUID, create a deterministic UUID from the string
-                namespace = UUID(
-                    "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
-                )  # DNS namespace
-                return UUID(
-                    hashlib.md5(
-                        f"{namespace}{v}".encode(), usedforsecurity=False
-                    ).hexdigest()
-                )
+            return _name_uuid(v)
         return v
 
+    @field_validator("class_code")
+    @classmethod
+    def intern_class_code(cls, v: str) -> str:
+        """Intern class codes so codes read from JSON share one string object."""
+        return sys.intern(v)
+
 
 class CRMRelation(BaseModel):
     """
@@ -105,10 +128,7 @@ class CRMRelation(BaseModel):
     def convert_string_to_uuid(cls, v: Any) -> Any:
         """Convert string IDs to UUIDs for backward compatibility."""
         if isinstance(v, str):
-            try:
-                return UUID(v)
-            except ValueError:
-                return uuid4()
+            return _name_uuid(v)
         return v
 
 
@@ -123,6 +143,11 @@ class CRMValidationWarning(Warning):
 # Core wrapper classes for high-use E-classes
 # These provide ergonomic shortcuts and additional methods
 
+# canonical_fields shared by several wrappers' JSON schema extras (pydantic
+# copies json_schema_extra when building a schema, so sharing is safe)
+_BASE_FIELDS: list[JsonValue] = ["label", "type", "notes"]
+_EVENT_FIELDS: list[JsonValue] = [*_BASE_FIELDS, "timespan", "took_place_at"]
+
 
 class E5_Event(CRMEntity):
     """Event - something that happened."""
@@ -136,7 +161,7 @@ class E5_Event(CRMEntity):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E5: Event",
-            "canonical_fields": ["label", "type", "notes", "timespan", "took_place_at"],
+            "canonical_fields": _EVENT_FIELDS,
         }
     )
 
@@ -149,7 +174,7 @@ class E7_Activity(E5_Event):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E7: Activity",
-            "canonical_fields": ["label", "type", "notes", "timespan", "took_place_at"],
+            "canonical_fields": _EVENT_FIELDS,
         }
     )
 
@@ -162,7 +187,7 @@ class E12_Production(E7_Activity):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E12: Production",
-            "canonical_fields": ["label", "type", "notes", "timespan", "took_place_at"],
+            "canonical_fields": _EVENT_FIELDS,
         }
     )
 
@@ -175,7 +200,7 @@ class E8_Acquisition(E7_Activity):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E8: Acquisition",
-            "canonical_fields": ["label", "type", "notes", "timespan", "took_place_at"],
+            "canonical_fields": _EVENT_FIELDS,
         }
     )
 
@@ -194,13 +219,7 @@ class E22_HumanMadeObject(CRMEntity):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E22: Human-Made Object",
-            "canonical_fields": [
-                "label",
-                "type",
-                "notes",
-                "current_location",
-                "produced_by",
-            ],
+            "canonical_fields": [*_BASE_FIELDS, "current_location", "produced_by"],
         }
     )
 
@@ -218,7 +237,7 @@ class E21_Person(CRMEntity):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E21: Person",
-            "canonical_fields": ["label", "type", "notes", "current_location"],
+            "canonical_fields": [*_BASE_FIELDS, "current_location"],
         }
     )
 
@@ -231,7 +250,7 @@ class E74_Group(CRMEntity):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E74: Group",
-            "canonical_fields": ["label", "type", "notes"],
+            "canonical_fields": _BASE_FIELDS,
         }
     )
 
@@ -244,7 +263,7 @@ class E53_Place(CRMEntity):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E53: Place",
-            "canonical_fields": ["label", "type", "notes"],
+            "canonical_fields": _BASE_FIELDS,
         }
     )
 
@@ -264,9 +283,7 @@ class E52_TimeSpan(CRMEntity):
         json_schema_extra={
             "description": "CIDOC CRM E52: Time-Span",
             "canonical_fields": [
-                "label",
-                "type",
-                "notes",
+                *_BASE_FIELDS,
                 "begin_of_the_begin",
                 "end_of_the_end",
             ],
@@ -282,7 +299,7 @@ class E42_Identifier(CRMEntity):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E42: Identifier",
-            "canonical_fields": ["label", "type", "notes"],
+            "canonical_fields": _BASE_FIELDS,
         }
     )
 
@@ -295,6 +312,92 @@ class E35_Title(CRMEntity):
     model_config = ConfigDict(
         json_schema_extra={
             "description": "CIDOC CRM E35: Title",
-            "canonical_fields": ["label", "type", "notes"],
+            "canonical_fields": _BASE_FIELDS,
         }
     )
+
+
+# Core wrapper class for each class code, for dispatching on class_code
+# instead of isinstance checks against the hierarchy
+CLASS_BY_CODE: dict[str, type[CRMEntity]] = {
+    cls.model_fields["class_code"].default: cls
+    for cls in (
+        E5_Event,
+        E7_Activity,
+        E8_Acquisition,
+        E12_Production,
+        E21_Person,
+        E22_HumanMadeObject,
+        E35_Title,
+        E42_Identifier,
+        E52_TimeSpan,
+        E53_Place,
+        E74_Group,
+    )
+}
+
+# Codes of each wrapper and its wrapper subclasses, e.g. "E5" -> E5/E7/E8/E12,
+# so hierarchy queries become ``entity.class_code in SUBCLASS_CODES["E5"]``
+SUBCLASS_CODES: dict[str, frozenset[str]] = {
+    code: frozenset(
+        sub_code for sub_code, sub in CLASS_BY_CODE.items() if issubclass(sub, cls)
+    )
+    for code, cls in CLASS_BY_CODE.items()
+}
+
+# Entity field holding the values of each P-property, read by the validators
+# (entities without that field simply have no values for the property)
+PROPERTY_FIELDS: dict[str, str] = {
+    "P1": "identifiers",
+    "P2": "type",
+    "P3": "notes",
+    "P4": "timespan",
+    "P7": "took_place_at",
+    "P11": "participants",
+    "P53": "current_location",
+    "P79": "begin_of_the_begin",
+    "P80": "end_of_the_end",
+    "P108": "produced_by",
+}
+
+_WRAPPER_CODES = {cls: code for code, cls in CLASS_BY_CODE.items()}
+
+
+def _entity_tag(value: Any) -> str:
+    """Discriminator for AnyCRMEntity.
+
+    Raw data is routed by its class_code; model instances keep their own
+    class, so a plain CRMEntity with class_code "E21" stays a CRMEntity.
+    Anything without a wrapper gets the catch-all "*" tag.
+    """
+    if isinstance(value, dict):
+        code = value.get("class_code")
+        return code if code in CLASS_BY_CODE else "*"
+    return _WRAPPER_CODES.get(type(value), "*")
+
+
+# Any CRM entity, validated straight to its core wrapper class by looking up
+# class_code (codes without a wrapper validate as a plain CRMEntity), so
+# shortcut fields such as E5 took_place_at survive a JSON round trip.
+AnyCRMEntity = Annotated[
+    Annotated[E5_Event, Tag("E5")]
+    | Annotated[E7_Activity, Tag("E7")]
+    | Annotated[E8_Acquisition, Tag("E8")]
+    | Annotated[E12_Production, Tag("E12")]
+    | Annotated[E21_Person, Tag("E21")]
+    | Annotated[E22_HumanMadeObject, Tag("E22")]
+    | Annotated[E35_Title, Tag("E35")]
+    | Annotated[E42_Identifier, Tag("E42")]
+    | Annotated[E52_TimeSpan, Tag("E52")]
+    | Annotated[E53_Place, Tag("E53")]
+    | Annotated[E74_Group, Tag("E74")]
+    | Annotated[CRMEntity, Tag("*")],
+    Discriminator(_entity_tag),
+]
+
+# Validates or serializes a whole entity list in a single pydantic-core call.
+# Pass serialize_as_any=True when dumping to keep subclass shortcut fields.
+# Built on first use so importing the models stays cheap.
+ENTITY_LIST_ADAPTER: TypeAdapter[list[AnyCRMEntity]] = TypeAdapter(
+    list[AnyCRMEntity], config=ConfigDict(defer_build=True)
+)
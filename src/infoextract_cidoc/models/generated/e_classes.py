@@ -7,6 +7,8 @@ DO NOT EDIT — regenerate with: make codegen
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from uuid import UUID
 
 from pydantic import Field
@@ -641,3 +643,114 @@ class E51_ContactPoint(E45_Address):
     """E51: Contact Point — a contact point such as phone or email"""
 
     class_code: str = "E51"
+
+
+# Generated model class for each class code
+_CODE_TO_CLS: Mapping[str, type[CRMEntity]] = MappingProxyType(
+    {
+        "E1": E1_CRMEntity,
+        "E18": E18_PhysicalThing,
+        "E23": E23_ConceptualObject,
+        "E2": E2_TemporalEntity,
+        "E39": E39_Actor,
+        "E43": E43_Place,
+        "E52": E52_TimeSpan,
+        "E59": E59_PrimitiveValue,
+        "E70": E70_Thing,
+        "E77": E77_PersistentItem,
+        "E92": E92_SpacetimeVolume,
+        "E19": E19_PhysicalObject,
+        "E24": E24_PhysicalManMadeThing,
+        "E26": E26_PhysicalFeature,
+        "E28": E28_ConceptualObject,
+        "E3": E3_ConditionState,
+        "E4": E4_Period,
+        "E5": E5_Event,
+        "E40": E40_LegalBody,
+        "E74": E74_Group,
+        "E46": E46_Section,
+        "E53": E53_Place,
+        "E60": E60_Number,
+        "E61": E61_TimePrimitive,
+        "E62": E62_String,
+        "E95": E95_SpacetimePrimitive,
+        "E71": E71_HumanMadeThing,
+        "E72": E72_LegalObject,
+        "E73": E73_InformationObject,
+        "E78": E78_CuratedHolding,
+        "E93": E93_Presence,
+        "E94": E94_Space,
+        "E20": E20_BiologicalObject,
+        "E22": E22_HumanMadeObject,
+        "E25": E25_ManMadeFeature,
+        "E27": E27_Site,
+        "E29": E29_DesignOrProcedure,
+        "E30": E30_Right,
+        "E31": E31_Document,
+        "E33": E33_LinguisticObject,
+        "E36": E36_VisualItem,
+        "E41": E41_Appellation,
+        "E42": E42_Identifier,
+        "E47": E47_SpatialCoordinates,
+        "E54": E54_Dimension,
+        "E55": E55_Type,
+        "E88": E88_PropositionalObject,
+        "E90": E90_SymbolicObject,
+        "E97": E97_MonetaryAmount,
+        "E63": E63_BeginningOfExistence,
+        "E64": E64_EndOfExistence,
+        "E6": E6_Destruction,
+        "E7": E7_Activity,
+        "E84": E84_InformationCarrier,
+        "E21": E21_Person,
+        "E32": E32_AuthorityDocument,
+        "E34": E34_Inscription,
+        "E35": E35_Title,
+        "E37": E37_Mark,
+        "E38": E38_Image,
+        "E44": E44_PlaceAppellation,
+        "E49": E49_TimeAppellation,
+        "E75": E75_ConceptualObjectAppellation,
+        "E76": E76_ConceptualObjectIdentifier,
+        "E56": E56_Language,
+        "E57": E57_Material,
+        "E58": E58_MeasurementUnit,
+        "E98": E98_Currency,
+        "E99": E99_ProductType,
+        "E89": E89_PropositionalStatement,
+        "E91": E91_KnowledgeObject,
+        "E65": E65_Creation,
+        "E66": E66_Formation,
+        "E68": E68_Dissolution,
+        "E69": E69_Death,
+        "E10": E10_TransferOfCustody,
+        "E11": E11_Modification,
+        "E12": E12_Production,
+        "E13": E13_AttributeAssignment,
+        "E85": E85_Joining,
+        "E86": E86_Leaving,
+        "E87": E87_CurationActivity,
+        "E8": E8_Acquisition,
+        "E9": E9_Move,
+        "E45": E45_Address,
+        "E48": E48_PlaceName,
+        "E50": E50_Date,
+        "E82": E82_ActorAppellation,
+        "E83": E83_TypeCreation,
+        "E67": E67_Birth,
+        "E79": E79_PartAddition,
+        "E80": E80_PartRemoval,
+        "E81": E81_Transformation,
+        "E14": E14_ConditionAssessment,
+        "E15": E15_IdentifierAssignment,
+        "E16": E16_Measurement,
+        "E17": E17_TypeAssignment,
+        "E96": E96_Purchase,
+        "E51": E51_ContactPoint,
+    }
+)
+
+
+def entity_class_for(code: str) -> type[CRMEntity]:
+    """Return the generated model class for class code *code* (e.g. "E22")."""
+    return _CODE_TO_CLS[code]
@@ -3,49 +3,41 @@ Golden test for museum object example.
 Tests the complete workflow from JSON to Markdown to Cypher.
 """
 
-import json
 from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
 
 from ...io.to_cypher import generate_cypher_parameters, generate_cypher_script
 from ...io.to_markdown import MarkdownStyle, render_table, to_markdown
-from ...models.generated.e_classes import (
-    E1_CRMEntity,
-    E12_Production,
-    E22_HumanMadeObject,
-    E52_TimeSpan,
-    E53_Place,
-    E61_TimePrimitive,
-)
+from ...models.base import CRMEntity
+from ...models.generated.e_classes import entity_class_for
 from ...validators.quantifiers import ValidationSeverity, validate_batch_quantifiers
 from ...validators.typing_rules import validate_batch_typing
 
 
-def test_museum_object_workflow():
-    """Test the complete museum object workflow."""
-    # Load the example data
+def _build_entities(data: dict[str, Any]) -> list[CRMEntity]:
+    """Instantiate the example's entities as their generated model classes."""
+    return [
+        entity_class_for(entity_data["class_code"])(**entity_data)
+        for entity_data in data["entities"]
+    ]
+
+
+@pytest.fixture(scope="module")
+def museum_entities() -> tuple[dict[str, Any], list[CRMEntity]]:
+    """Load the museum object example once per module, with its entities."""
     example_file = (
         Path(__file__).parent.parent.parent / "examples" / "museum_object.json"
     )
-    with example_file.open() as f:
-        data = json.load(f)
-
-    # Create entities from JSON
-    entities = []
-    for entity_data in data["entities"]:
-        if entity_data["class_code"] == "E22":
-            entity = E22_HumanMadeObject(**entity_data)
-        elif entity_data["class_code"] == "E12":
-            entity = E12_Production(**entity_data)
-        elif entity_data["class_code"] == "E53":
-            entity = E53_Place(**entity_data)
-        elif entity_data["class_code"] == "E52":
-            entity = E52_TimeSpan(**entity_data)
-        elif entity_data["class_code"] == "E61":
-            entity = E61_TimePrimitive(**entity_data)
-        else:
-            entity = E1_CRMEntity(**entity_data)
-
-        entities.append(entity)
+    data = orjson.loads(example_file.read_bytes())
+    return data, _build_entities(data)
+
+
+def test_museum_object_workflow(museum_entities):
+    """Test the complete museum object workflow."""
+    _, entities = museum_entities
 
     # Test Markdown rendering
     vase = entities[0]  # E22_HumanMadeObject
@@ -124,31 +116,9 @@ def test_museum_object_workflow():
     assert production_rels[0]["src"] == vase_node["id"]
 
 
-def test_museum_object_validation():
+def test_museum_object_validation(museum_entities):
     """Test validation of the museum object example."""
-    # Load and create entities
-    example_file = (
-        Path(__file__).parent.parent.parent / "examples" / "museum_object.json"
-    )
-    with example_file.open() as f:
-        data = json.load(f)
-
-    entities = []
-    for entity_data in data["entities"]:
-        if entity_data["class_code"] == "E22":
-            entity = E22_HumanMadeObject(**entity_data)
-        elif entity_data["class_code"] == "E12":
-            entity = E12_Production(**entity_data)
-        elif entity_data["class_code"] == "E53":
-            entity = E53_Place(**entity_data)
-        elif entity_data["class_code"] == "E52":
-            entity = E52_TimeSpan(**entity_data)
-        elif entity_data["class_code"] == "E61":
-            entity = E61_TimePrimitive(**entity_data)
-        else:
-            entity = E1_CRMEntity(**entity_data)
-
-        entities.append(entity)
+    _, entities = museum_entities
 
     # Test quantifier validation
     quantifier_results = validate_batch_quantifiers(entities, ValidationSeverity.WARN)
@@ -159,35 +129,14 @@ def test_museum_object_validation():
     assert len(typing_results) == 0  # Should have no validation issues
 
 
-def test_museum_object_roundtrip():
+def test_museum_object_roundtrip(museum_entities):
     """Test roundtrip conversion from JSON to entities and back."""
-    # Load the example data
-    example_file = (
-        Path(__file__).parent.parent.parent / "examples" / "museum_object.json"
+    original_data, entities = museum_entities
+
+    # Convert back to JSON (UUIDs serialize to the same strings as the input)
+    converted_data = orjson.loads(
+        orjson.dumps({"entities": [entity.model_dump() for entity in entities]})
     )
-    with example_file.open() as f:
-        original_data = json.load(f)
-
-    # Create entities from JSON
-    entities = []
-    for entity_data in original_data["entities"]:
-        if entity_data["class_code"] == "E22":
-            entity = E22_HumanMadeObject(**entity_data)
-        elif entity_data["class_code"] == "E12":
-            entity = E12_Production(**entity_data)
-        elif entity_data["class_code"] == "E53":
-            entity = E53_Place(**entity_data)
-        elif entity_data["class_code"] == "E52":
-            entity = E52_TimeSpan(**entity_data)
-        elif entity_data["class_code"] == "E61":
-            entity = E61_TimePrimitive(**entity_data)
-        else:
-            entity = E1_CRMEntity(**entity_data)
-
-        entities.append(entity)
-
-    # Convert back to JSON
-    converted_data = {"entities": [entity.dict() for entity in entities]}
 
     # Verify that key data is preserved
     assert len(converted_data["entities"]) == len(original_data["entities"])
@@ -203,8 +152,5 @@ def test_museum_object_roundtrip():
     assert original_vase["class_code"] == converted_vase["class_code"]
     assert original_vase["label"] == converted_vase["label"]
     assert original_vase["type"] == converted_vase["type"]
-    # Convert UUID objects to strings for comparison
-    assert str(original_vase["current_location"]) == str(
-        converted_vase["current_location"]
-    )
-    assert str(original_vase["produced_by"]) == str(converted_vase["produced_by"])
+    assert original_vase["current_location"] == converted_vase["current_location"]
+    assert original_vase["produced_by"] == converted_vase["produced_by"]
@@ -23,7 +23,7 @@ from infoextract_cidoc.io.to_cypher import generate_cypher_script
 from infoextract_cidoc.io.to_markdown import MarkdownStyle, to_markdown
 from infoextract_cidoc.io.to_networkx import to_networkx_graph
 
-_EINSTEIN_TEXT = (Path(__file__).parent.parent / "examples" / "einstein.md").read_text()
+_EINSTEIN_FILE = Path(__file__).parent.parent / "examples" / "einstein.md"
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -37,7 +37,7 @@ def _require_api_key() -> None:
 def einstein_result():
     """Run the full pipeline on the Einstein biography (single LLM call per session)."""
     extractor = LangStructExtractor()
-    lite = extractor.extract(_EINSTEIN_TEXT)
+    lite = extractor.extract(_EINSTEIN_FILE.read_text(encoding="utf-8"))
     resolved = resolve_extraction(lite)
     entities, relations = map_to_crm_entities(resolved)
     return lite, entities, relations
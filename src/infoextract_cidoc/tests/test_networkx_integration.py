@@ -5,9 +5,18 @@ This module tests the new NetworkX integration, visualization,
 and complete workflow functionality.
 """
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+from uuid import uuid4
+
 import networkx as nx
+import orjson
 import pytest
+from matplotlib.figure import Figure
 
+import infoextract_cidoc
 from infoextract_cidoc.extraction.models import (
     ExtractedEntity,
     ExtractedRelationship,
@@ -15,10 +24,29 @@ from infoextract_cidoc.extraction.models import (
 )
 from infoextract_cidoc.io.to_networkx import (
     calculate_centrality_measures,
+    count_entity_types,
+    entities_to_networkx,
+    extract_edge_attributes,
+    extract_node_attributes,
+    extract_node_attributes_grouped,
     find_communities,
     get_network_statistics,
     to_networkx_graph,
+    to_networkx_graph_from_dicts,
+)
+from infoextract_cidoc.io.to_networkx.attributes import entity_attributes
+from infoextract_cidoc.io.to_networkx.converters import (
+    export_graph_to_dataframe,
+    export_graph_to_json_bytes,
+    export_graph_to_records,
+    filter_graph_by_attribute,
+    get_subgraph_by_entity_type,
+    merge_graphs,
 )
+from infoextract_cidoc.io.to_networkx.graph_builder import (
+    extraction_result_to_networkx,
+)
+from infoextract_cidoc.models import ENTITY_LIST_ADAPTER, E5_Event
 from infoextract_cidoc.models.base import CRMEntity
 from infoextract_cidoc.visualization import (
     create_interactive_plot,
@@ -29,6 +57,13 @@ from infoextract_cidoc.visualization import (
 )
 
 
+# A bare Figure skips pyplot; plot_network_graph clears the axes on each reuse
+@pytest.fixture(scope="module")
+def plot_axes():
+    """Axes shared by the static plot tests."""
+    return Figure().subplots()
+
+
 class TestNetworkXIntegration:
     """Test NetworkX integration functionality."""
 
@@ -102,8 +137,10 @@ class TestNetworkXIntegration:
             [("A", "B"), ("B", "C"), ("C", "A"), ("A", "D"), ("B", "D")]
         )
 
-        # Calculate centrality measures
-        centrality_measures = calculate_centrality_measures(graph)
+        # Calculate the centrality measures asserted on below
+        centrality_measures = calculate_centrality_measures(
+            graph, include_eigenvector=False
+        )
 
         # Verify measures are calculated
         assert "degree" in centrality_measures
@@ -140,6 +177,37 @@ class TestNetworkXIntegration:
         assert len(communities) >= 1
         assert len(communities[0]) >= 3  # At least one community should have 3+ nodes
 
+    def test_analysis_backend_passthrough(self):
+        """Test explicit NetworkX backend selection and Louvain communities."""
+        graph = nx.Graph()
+        graph.add_edges_from([("A", "B"), ("B", "C"), ("A", "C")])
+        graph.add_edges_from([("D", "E"), ("E", "F"), ("D", "F")])
+        graph.add_edge("C", "D")
+
+        assert calculate_centrality_measures(
+            graph, backend="networkx"
+        ) == calculate_centrality_measures(graph)
+
+        communities = find_communities(graph, algorithm="louvain", backend="networkx")
+        assert sorted(sorted(c) for c in communities) == [
+            ["A", "B", "C"],
+            ["D", "E", "F"],
+        ]
+
+    def test_to_networkx_graph_from_dicts_matches_models(self):
+        """Test that the dict path builds the same nodes as the model path."""
+        entities = [
+            CRMEntity(id="person1", class_code="E21", label="Albert Einstein"),
+            CRMEntity(id="place1", class_code="E53", notes="New Jersey"),
+        ]
+        dicts = orjson.loads(ENTITY_LIST_ADAPTER.dump_json(entities))
+
+        expected = to_networkx_graph(entities)
+        graph = to_networkx_graph_from_dicts(dicts)
+
+        assert isinstance(graph, nx.DiGraph)
+        assert dict(graph.nodes(data=True)) == dict(expected.nodes(data=True))
+
     def test_get_network_statistics(self):
         """Test network statistics calculation."""
         # Create test graph
@@ -166,9 +234,226 @@ class TestNetworkXIntegration:
         assert stats["entity_type_distribution"]["E53"] == 2
 
 
+class TestGraphConverters:
+    """Test graph conversion and filtering helpers."""
+
+    @staticmethod
+    def _typed_graph() -> nx.DiGraph:
+        graph = nx.DiGraph()
+        graph.add_nodes_from(
+            [
+                ("A", {"class_code": "E21"}),
+                ("B", {"class_code": "E21"}),
+                ("C", {"class_code": "E53"}),
+            ]
+        )
+        graph.add_edge("A", "B", property_code="P107")
+        graph.add_edge("A", "C", property_code="P74")
+        return graph
+
+    def test_entities_to_networkx(self):
+        """Test node conversion with and without the full attribute dump."""
+        entity = CRMEntity(class_code="E21", label="Albert Einstein", notes="x")
+
+        node_ids, node_data = entities_to_networkx([entity])
+        _, lean_data = entities_to_networkx([entity], include_all_attributes=False)
+
+        assert node_ids == [str(entity.id)]
+        assert node_data[0]["notes"] == "x"
+        assert "id" not in node_data[0]
+        assert lean_data == [{"class_code": "E21", "label": "Albert Einstein"}]
+
+    def test_entity_attributes_match_model_dump(self):
+        """The attribute fast path matches model_dump and copies lists."""
+        event = E5_Event(label="Birth", type=["E55:Birth"], took_place_at=uuid4())
+
+        attributes = entity_attributes(event, frozenset({"id"}))
+
+        assert attributes == event.model_dump(exclude={"id"})
+        assert attributes["type"] is not event.type
+
+    def test_filter_graph_by_attribute_returns_view(self):
+        """Test that filtering returns a view and leaves the input intact."""
+        graph = self._typed_graph()
+
+        filtered = filter_graph_by_attribute(graph, "class_code", "E21")
+
+        assert set(filtered.nodes()) == {"A", "B"}
+        assert list(filtered.edges()) == [("A", "B")]
+        assert graph.number_of_nodes() == 3
+        with pytest.raises(nx.NetworkXError):
+            filtered.add_node("D")
+
+    def test_filter_graph_by_attribute_edges(self):
+        """Test edge filtering on the view."""
+        graph = self._typed_graph()
+
+        filtered = filter_graph_by_attribute(
+            graph, "property_code", "P74", filter_nodes=False, filter_edges=True
+        )
+
+        assert filtered.number_of_nodes() == 3
+        assert list(filtered.edges()) == [("A", "C")]
+
+    def test_filter_graph_by_attribute_inplace(self):
+        """Test that inplace filtering mutates and returns the input graph."""
+        graph = self._typed_graph()
+
+        filtered = filter_graph_by_attribute(graph, "class_code", "E53", inplace=True)
+
+        assert filtered is graph
+        assert set(graph.nodes()) == {"C"}
+
+    def test_filter_graph_by_attribute_inplace_edges(self):
+        """Test inplace edge filtering on directed and undirected graphs."""
+        for graph in (self._typed_graph(), self._typed_graph().to_undirected()):
+            filter_graph_by_attribute(
+                graph,
+                "property_code",
+                "P74",
+                filter_nodes=False,
+                filter_edges=True,
+                inplace=True,
+            )
+
+            assert {frozenset(edge) for edge in graph.edges()} == {
+                frozenset(("A", "C"))
+            }
+
+    def test_extract_edge_attributes(self):
+        """Test edge attribute extraction on directed and undirected graphs."""
+        directed = self._typed_graph()
+
+        assert extract_edge_attributes(directed, "property_code") == {
+            ("A", "B"): "P107",
+            ("A", "C"): "P74",
+        }
+        assert len(extract_edge_attributes(directed.to_undirected(), "x")) == 2
+
+    def test_count_entity_types(self):
+        """Test class-code counting, including nodes without a class code."""
+        graph = self._typed_graph()
+        graph.add_node("D")
+
+        assert count_entity_types(graph) == {"E21": 2, "E53": 1, "Unknown": 1}
+
+    def test_extract_node_attributes_grouped(self):
+        """Test grouping nodes by attribute value."""
+        graph = self._typed_graph()
+        graph.add_node("D")
+
+        assert extract_node_attributes(graph, "class_code")["D"] is None
+        assert extract_node_attributes_grouped(graph, "class_code") == {
+            "E21": ["A", "B"],
+            "E53": ["C"],
+            None: ["D"],
+        }
+
+    def test_get_subgraph_by_entity_type(self):
+        """Test selecting the subgraph of one entity type."""
+        subgraph = get_subgraph_by_entity_type(self._typed_graph(), "E21")
+
+        assert set(subgraph.nodes()) == {"A", "B"}
+        assert list(subgraph.edges()) == [("A", "B")]
+
+    def test_merge_graphs(self):
+        """Test union/intersection merges and the single-graph fast path."""
+        first = self._typed_graph()
+        second = nx.DiGraph()
+        second.add_edge("A", "B", property_code="P107")
+        second.add_edge("B", "D", property_code="P74")
+
+        union = merge_graphs([first, second])
+        intersection = merge_graphs([first, second], merge_strategy="intersection")
+
+        assert set(union.nodes()) == {"A", "B", "C", "D"}
+        assert union.number_of_edges() == 3
+        assert union.nodes["A"]["class_code"] == "E21"
+        assert set(intersection.nodes()) == {"A", "B"}
+        assert list(intersection.edges()) == [("A", "B")]
+        assert first.number_of_nodes() == 3
+        assert merge_graphs([first]) is first
+        assert merge_graphs([first], copy=True) is not first
+        with pytest.raises(ValueError, match="Unknown merge strategy"):
+            merge_graphs([first, second], merge_strategy="xor")
+
+    def test_export_graph_records_and_json(self):
+        """Test plain-record, JSON and DataFrame exports agree."""
+        graph = self._typed_graph()
+
+        node_records, edge_records = export_graph_to_records(graph)
+        payload = orjson.loads(export_graph_to_json_bytes(graph))
+        nodes_df, edges_df = export_graph_to_dataframe(graph)
+
+        assert node_records[0] == {"node_id": "A", "class_code": "E21"}
+        assert edge_records[0] == {
+            "source": "A",
+            "target": "B",
+            "property_code": "P107",
+        }
+        assert payload == {"nodes": node_records, "edges": edge_records}
+        assert list(nodes_df["node_id"]) == ["A", "B", "C"]
+        assert len(edges_df) == 2
+
+    def test_extraction_result_to_networkx_properties(self):
+        """Test that extra properties are merged without shadowing core fields."""
+        person = ExtractedEntity(
+            class_code="E21",
+            label="Albert Einstein",
+            confidence=0.9,
+            properties={"occupation": "physicist", "label": "ignored"},
+        )
+        place = ExtractedEntity(class_code="E53", label="Ulm", confidence=0.8)
+        dropped = ExtractedEntity(class_code="E53", label="Nowhere", confidence=0.1)
+        result = ExtractionResult(
+            entities=[person, place, dropped],
+            relationships=[
+                ExtractedRelationship(
+                    source_id=person.id,
+                    target_id=place.id,
+                    property_code="P98",
+                    property_label="brought into life",
+                    confidence=0.9,
+                    properties={"certainty": "high"},
+                ),
+                ExtractedRelationship(
+                    source_id=person.id,
+                    target_id=dropped.id,
+                    property_code="P74",
+                    property_label="has current or former residence",
+                    confidence=0.9,
+                ),
+            ],
+        )
+
+        graph = extraction_result_to_networkx(result)
+
+        assert graph.number_of_nodes() == 2
+        person_data = graph.nodes[str(person.id)]
+        assert person_data["label"] == "Albert Einstein"
+        assert person_data["occupation"] == "physicist"
+        assert list(graph.edges()) == [(str(person.id), str(place.id))]
+        edge_data = graph.edges[str(person.id), str(place.id)]
+        assert edge_data["property_code"] == "P98"
+        assert edge_data["certainty"] == "high"
+
+
 class TestVisualization:
     """Test visualization functionality."""
 
+    def test_network_summary_import_is_lightweight(self):
+        """Test that the summary helper does not import pyplot or pandas."""
+        code = (
+            "import sys\n"
+            "from infoextract_cidoc.visualization import create_network_summary\n"
+            "assert 'matplotlib.pyplot' not in sys.modules\n"
+            "assert 'pandas' not in sys.modules\n"
+        )
+        src_dir = Path(infoextract_cidoc.__file__).parents[1]
+        env = {**os.environ, "PYTHONPATH": str(src_dir)}
+
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)  # noqa: S603
+
     def test_get_node_colors(self):
         """Test node color assignment."""
         graph = nx.Graph()
@@ -211,7 +496,7 @@ class TestVisualization:
         node_sizes = dict(zip(graph.nodes(), sizes, strict=False))
         assert node_sizes["A"] >= node_sizes["D"]
 
-    def test_plot_network_graph_creation(self):
+    def test_plot_network_graph_creation(self, plot_axes):
         """Test static network plot creation."""
         graph = nx.Graph()
         graph.add_edges_from([("A", "B"), ("B", "C"), ("C", "A")])
@@ -219,12 +504,17 @@ class TestVisualization:
         graph.nodes["B"]["class_code"] = "E53"
         graph.nodes["C"]["class_code"] = "E5"
 
-        # Test plot creation (without showing)
+        # Test plot creation (without showing); circular skips the spring layout
         fig = plot_network_graph(
-            graph, title="Test Network", show_plot=False, save_path=None
+            graph,
+            title="Test Network",
+            layout="circular",
+            show_plot=False,
+            save_path=None,
+            ax=plot_axes,
         )
 
-        assert fig is not None
+        assert fig is plot_axes.figure
         assert hasattr(fig, "axes")
 
     def test_create_interactive_plot(self):
@@ -314,7 +604,7 @@ class TestExtractionModels:
 class TestCompleteWorkflow:
     """Test complete workflow integration."""
 
-    def test_workflow_integration(self):
+    def test_workflow_integration(self, plot_axes):
         """Test integration of all workflow components."""
         # Create test entities
         entities = [
@@ -327,16 +617,24 @@ class TestCompleteWorkflow:
         graph = to_networkx_graph(entities)
         assert graph.number_of_nodes() == 3
 
-        # Test centrality calculation
-        centrality_measures = calculate_centrality_measures(graph)
-        assert "degree" in centrality_measures
+        # Test centrality calculation (only degree is checked here)
+        centrality_measures = calculate_centrality_measures(
+            graph,
+            include_betweenness=False,
+            include_closeness=False,
+            include_eigenvector=False,
+            include_pagerank=False,
+        )
+        assert list(centrality_measures) == ["degree"]
 
         # Test community detection
         communities = find_communities(graph)
         assert isinstance(communities, list)
 
         # Test visualization
-        fig = plot_network_graph(graph, show_plot=False, save_path=None)
+        fig = plot_network_graph(
+            graph, layout="circular", show_plot=False, save_path=None, ax=plot_axes
+        )
         assert fig is not None
 
         # Test interactive plot
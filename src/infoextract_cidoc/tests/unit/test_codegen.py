@@ -17,76 +17,83 @@ from infoextract_cidoc.models.generated.e_classes import (
     E53_Place,
 )
 
+_CODEGEN_DIR = Path(__file__).parents[2] / "codegen"
 
-@pytest.mark.unit
-class TestGeneratedClassHierarchy:
-    """Verify the generated class hierarchy reflects the LinkML schema."""
 
-    def test_root_inherits_crm_entity(self):
-        assert issubclass(E1_CRMEntity, CRMEntity)
+# SchemaView parses the YAML and memoizes all_classes()/all_slots(), so one
+# view per schema is shared by every test in the module
+@pytest.fixture(scope="module")
+def crm_schema_view():
+    """SchemaView over the E-class schema."""
+    from linkml_runtime.utils.schemaview import SchemaView
+
+    return SchemaView(str(_CODEGEN_DIR / "cidoc_crm.yaml"))
 
-    def test_event_inherits_from_root(self):
-        assert issubclass(E5_Event, E1_CRMEntity)
 
-    def test_activity_inherits_from_event(self):
-        assert issubclass(E7_Activity, E5_Event)
+@pytest.fixture(scope="module")
+def crm_props_view():
+    """SchemaView over the property schema."""
+    from linkml_runtime.utils.schemaview import SchemaView
 
-    def test_production_inherits_from_activity(self):
-        assert issubclass(E12_Production, E7_Activity)
+    return SchemaView(str(_CODEGEN_DIR / "cidoc_crm_properties.yaml"))
 
-    def test_person_inherits_physical_object(self):
-        assert issubclass(E21_Person, E19_PhysicalObject)
 
-    def test_place_is_crm_entity(self):
-        assert issubclass(E53_Place, CRMEntity)
+@pytest.mark.unit
+class TestGeneratedClassHierarchy:
+    """Verify the generated class hierarchy reflects the LinkML schema."""
 
-    def test_timespan_is_crm_entity(self):
-        assert issubclass(E52_TimeSpan, CRMEntity)
+    @pytest.mark.parametrize(
+        ("child", "parent"),
+        [
+            (E1_CRMEntity, CRMEntity),
+            (E5_Event, E1_CRMEntity),
+            (E7_Activity, E5_Event),
+            (E12_Production, E7_Activity),
+            (E21_Person, E19_PhysicalObject),
+            (E53_Place, CRMEntity),
+            (E52_TimeSpan, CRMEntity),
+        ],
+    )
+    def test_hierarchy(self, child, parent):
+        assert issubclass(child, parent)
 
 
 @pytest.mark.unit
 class TestGeneratedClassCodes:
     """Verify class_code defaults match E-numbers."""
 
-    def test_event_class_code(self):
-        e = E5_Event(class_code="E5", label="test")
-        assert e.class_code == "E5"
-
-    def test_person_class_code(self):
-        p = E21_Person(class_code="E21", label="Alice")
-        assert p.class_code == "E21"
-
-    def test_timespan_class_code(self):
-        ts = E52_TimeSpan(class_code="E52")
-        assert ts.class_code == "E52"
+    @pytest.mark.parametrize(
+        ("cls", "code", "kwargs"),
+        [
+            (E5_Event, "E5", {"label": "test"}),
+            (E21_Person, "E21", {"label": "Alice"}),
+            (E52_TimeSpan, "E52", {}),
+        ],
+    )
+    def test_class_code(self, cls, code, kwargs):
+        assert cls(class_code=code, **kwargs).class_code == code
 
 
 @pytest.mark.unit
 class TestShortcutFieldInheritance:
     """Verify shortcut fields appear on the correct classes."""
 
-    def test_event_has_timespan_slot(self):
-        assert "timespan" in E5_Event.model_fields
-
-    def test_event_has_took_place_at_slot(self):
-        assert "took_place_at" in E5_Event.model_fields
-
-    def test_activity_inherits_timespan(self):
-        # E7_Activity extends E5_Event — inherits slots via Python class hierarchy
-        assert "timespan" in E7_Activity.model_fields
-
-    def test_physical_object_has_current_location(self):
-        assert "current_location" in E19_PhysicalObject.model_fields
-
-    def test_human_made_object_has_produced_by(self):
-        assert "produced_by" in E22_HumanMadeObject.model_fields
-
-    def test_human_made_object_inherits_current_location(self):
-        assert "current_location" in E22_HumanMadeObject.model_fields
-
-    def test_timespan_has_temporal_slots(self):
-        assert "begin_of_the_begin" in E52_TimeSpan.model_fields
-        assert "end_of_the_end" in E52_TimeSpan.model_fields
+    # Inherited slots (E7 from E5, E22 from E19) come via the Python hierarchy
+    @pytest.mark.parametrize(
+        ("cls", "slot"),
+        [
+            (E5_Event, "timespan"),
+            (E5_Event, "took_place_at"),
+            (E7_Activity, "timespan"),
+            (E19_PhysicalObject, "current_location"),
+            (E22_HumanMadeObject, "produced_by"),
+            (E22_HumanMadeObject, "current_location"),
+            (E52_TimeSpan, "begin_of_the_begin"),
+            (E52_TimeSpan, "end_of_the_end"),
+        ],
+    )
+    def test_has_shortcut_slot(self, cls, slot):
+        assert slot in cls.model_fields
 
     def test_place_has_no_shortcut_slots(self):
         # E53_Place has no shortcut fields
@@ -104,20 +111,12 @@ class TestCodegenSchema:
         schema = Path(__file__).parents[2] / "codegen" / "cidoc_crm.yaml"
         assert schema.exists(), f"cidoc_crm.yaml not found at {schema}"
 
-    def test_schema_loadable(self):
-        from linkml_runtime.utils.schemaview import SchemaView
-
-        schema = Path(__file__).parents[2] / "codegen" / "cidoc_crm.yaml"
-        sv = SchemaView(str(schema))
-        classes = sv.all_classes()
+    def test_schema_loadable(self, crm_schema_view):
+        classes = crm_schema_view.all_classes()
         assert len(classes) == 99
 
-    def test_schema_has_shortcut_slots(self):
-        from linkml_runtime.utils.schemaview import SchemaView
-
-        schema = Path(__file__).parents[2] / "codegen" / "cidoc_crm.yaml"
-        sv = SchemaView(str(schema))
-        slots = sv.all_slots()
+    def test_schema_has_shortcut_slots(self, crm_schema_view):
+        slots = crm_schema_view.all_slots()
         assert "timespan" in slots
         assert "took_place_at" in slots
         assert "current_location" in slots
@@ -134,23 +133,15 @@ class TestPropertySchema:
         schema = Path(__file__).parents[2] / "codegen" / "cidoc_crm_properties.yaml"
         assert schema.exists(), f"cidoc_crm_properties.yaml not found at {schema}"
 
-    def test_schema_loadable(self):
-        from linkml_runtime.utils.schemaview import SchemaView
-
-        schema = Path(__file__).parents[2] / "codegen" / "cidoc_crm_properties.yaml"
-        sv = SchemaView(str(schema))
-        all_slots = sv.all_slots()
+    def test_schema_loadable(self, crm_props_view):
+        all_slots = crm_props_view.all_slots()
         crm_slots = [
             s for s in all_slots.values() if "crm_code" in (s.annotations or {})
         ]
         assert len(crm_slots) == 322
 
-    def test_all_inverse_pairs_symmetric(self):
-        from linkml_runtime.utils.schemaview import SchemaView
-
-        schema = Path(__file__).parents[2] / "codegen" / "cidoc_crm_properties.yaml"
-        sv = SchemaView(str(schema))
-        all_slots = sv.all_slots()
+    def test_all_inverse_pairs_symmetric(self, crm_props_view):
+        all_slots = crm_props_view.all_slots()
         crm_slots = {
             s.annotations["crm_code"].value: s
             for s in all_slots.values()
@@ -171,13 +162,9 @@ class TestPropertySchema:
                     or inv_slot.inverse is not None
                 ), f"{code}: inverse slot {inv_slot_name!r} has no back-reference"
 
-    def test_all_domain_range_reference_valid_eclasses(self):
-        from linkml_runtime.utils.schemaview import SchemaView
-
-        schema = Path(__file__).parents[2] / "codegen" / "cidoc_crm_properties.yaml"
-        sv = SchemaView(str(schema))
-        all_classes = sv.all_classes()
-        all_slots = sv.all_slots()
+    def test_all_domain_range_reference_valid_eclasses(self, crm_props_view):
+        all_classes = crm_props_view.all_classes()
+        all_slots = crm_props_view.all_slots()
         for slot in all_slots.values():
             if "crm_code" not in (slot.annotations or {}):
                 continue
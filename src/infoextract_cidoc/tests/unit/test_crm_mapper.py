@@ -12,7 +12,8 @@ from infoextract_cidoc.extraction.resolution import resolve_extraction
 from infoextract_cidoc.models.base import CRMEntity, CRMRelation
 
 
-@pytest.fixture
+# map_to_crm_entities only reads the result, so one resolution is shared
+@pytest.fixture(scope="module")
 def sample_extraction_result():
     lite_result = LiteExtractionResult(
         entities=[
@@ -10,7 +10,9 @@ from ...io.to_cypher import (
     expand_shortcuts,
     generate_cypher_parameters,
     generate_cypher_script,
+    iter_cypher_statements,
     validate_cypher_script,
+    write_cypher_script,
 )
 from ...models.generated.e_classes import (
     E22_HumanMadeObject,
@@ -229,3 +231,46 @@ class TestCypherEmission:
         assert "nodes_0" in params
         assert "nodes_1" in params
         assert "nodes_2" in params
+
+    def test_iter_cypher_statements_matches_script(self):
+        """Joining the streamed lines reproduces the full script."""
+        place = E53_Place(id=uuid4(), class_code="E53", label="Athens, Greece")
+        entities = [
+            place,
+            *(
+                E22_HumanMadeObject(
+                    id=uuid4(), class_code="E22", current_location=place.id
+                )
+                for _ in range(3)
+            ),
+        ]
+
+        lines = list(iter_cypher_statements(entities, batch_size=2))
+
+        assert all("\n" not in line for line in lines)
+        assert "\n".join(lines) == generate_cypher_script(entities, batch_size=2)
+        assert "UNWIND $rels_P53_HAS_CURRENT_LOCATION_1 AS r" in lines
+
+    def test_generate_cypher_script_accepts_generator(self):
+        """A one-shot iterable still yields both nodes and relationships."""
+        place = E53_Place(id=uuid4(), class_code="E53", label="Athens, Greece")
+        vase = E22_HumanMadeObject(
+            id=uuid4(), class_code="E22", current_location=place.id
+        )
+
+        script = generate_cypher_script(e for e in [place, vase])
+
+        assert "-- Create nodes" in script
+        assert "-- Create relationships" in script
+
+    def test_write_cypher_script(self, tmp_path):
+        """Streaming to disk writes exactly the generated script."""
+        entities = [
+            E22_HumanMadeObject(id=uuid4(), class_code="E22", label="Ancient Vase"),
+            E53_Place(id=uuid4(), class_code="E53", label="Athens, Greece"),
+        ]
+        path = tmp_path / "entities.cypher"
+
+        write_cypher_script(entities, path)
+
+        assert path.read_text(encoding="utf-8") == generate_cypher_script(entities)
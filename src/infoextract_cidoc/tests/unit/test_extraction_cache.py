@@ -0,0 +1,112 @@
+"""Unit tests for the on-disk extraction cache."""
+
+import asyncio
+
+import pytest
+
+from infoextract_cidoc.extraction import cache as cache_module
+from infoextract_cidoc.extraction.cache import (
+    ExtractionCache,
+    cache_key,
+    cached_extract,
+    cached_extract_many,
+    default_cache_dir,
+)
+from infoextract_cidoc.extraction.lite_schema import LiteEntity, LiteExtractionResult
+
+
+class _CountingExtractor:
+    """Stand-in for LangStructExtractor that records LLM calls."""
+
+    def __init__(self, model: str = "test/model") -> None:
+        self.model = model
+        self.calls: list[str] = []
+
+    def _result(self, text: str) -> LiteExtractionResult:
+        self.calls.append(text)
+        return LiteExtractionResult(
+            entities=[LiteEntity(ref_id="person_1", entity_type="Person", label=text)]
+        )
+
+    async def extract_async(self, text: str) -> LiteExtractionResult:
+        return self._result(text)
+
+    async def extract_many_async(
+        self, texts: list[str], *, max_workers: int | None = None
+    ) -> list[LiteExtractionResult]:
+        return [self._result(text) for text in texts]
+
+
+@pytest.mark.unit
+class TestExtractionCache:
+    def test_cache_key_depends_on_model_and_text(self) -> None:
+        assert cache_key("a", "text") == cache_key("a", "text")
+        assert cache_key("a", "text") != cache_key("b", "text")
+        assert cache_key("a", "text") != cache_key("a", "other")
+
+    def test_cache_key_parts_are_unambiguous(self) -> None:
+        assert cache_key("a|b", "c") != cache_key("a", "b|c")
+        assert cache_key("ab", "c") != cache_key("a", "bc")
+
+    def test_cache_key_depends_on_prompt(self, monkeypatch) -> None:
+        before = cache_key("a", "text")
+        monkeypatch.setattr(cache_module, "_prompt_fingerprint", lambda: "revised")
+
+        assert cache_key("a", "text") != before
+
+    def test_default_cache_dir_honours_xdg(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "infoextract-cidoc"
+
+    def test_cached_extract_hits_on_repeat(self, tmp_path) -> None:
+        cache = ExtractionCache(tmp_path)
+        extractor = _CountingExtractor()
+
+        first = asyncio.run(cached_extract(extractor, "Einstein", cache=cache))
+        second = asyncio.run(cached_extract(extractor, "Einstein", cache=cache))
+
+        assert first == second
+        assert extractor.calls == ["Einstein"]
+
+    def test_model_change_misses(self, tmp_path) -> None:
+        cache = ExtractionCache(tmp_path)
+        asyncio.run(cached_extract(_CountingExtractor("a"), "Einstein", cache=cache))
+        other = _CountingExtractor("b")
+
+        asyncio.run(cached_extract(other, "Einstein", cache=cache))
+
+        assert other.calls == ["Einstein"]
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path) -> None:
+        cache = ExtractionCache(tmp_path)
+        (tmp_path / f"{cache_key('test/model', 'Einstein')}.json").write_text("{")
+
+        assert cache.get("test/model", "Einstein") is None
+
+    def test_cached_extract_many_only_sends_misses(self, tmp_path) -> None:
+        cache = ExtractionCache(tmp_path)
+        extractor = _CountingExtractor()
+        asyncio.run(cached_extract(extractor, "Curie", cache=cache))
+
+        results = asyncio.run(
+            cached_extract_many(extractor, ["Einstein", "Curie"], cache=cache)
+        )
+
+        assert [r.entities[0].label for r in results] == ["Einstein", "Curie"]
+        assert extractor.calls == ["Curie", "Einstein"]
+
+    def test_cached_extract_many_rejects_short_batches(self, tmp_path) -> None:
+        class _ShortExtractor(_CountingExtractor):
+            async def extract_many_async(
+                self, texts: list[str], *, max_workers: int | None = None
+            ) -> list[LiteExtractionResult]:
+                return [self._result(text) for text in texts[1:]]
+
+        with pytest.raises(ValueError, match="zip"):
+            asyncio.run(
+                cached_extract_many(
+                    _ShortExtractor(),
+                    ["Einstein", "Curie"],
+                    cache=ExtractionCache(tmp_path),
+                )
+            )
@@ -87,3 +87,27 @@ class TestLangStructExtractor:
             result = asyncio.run(extractor.extract_async("Einstein was born in Ulm."))
 
         assert result == mock_lite_result
+
+    def test_extract_many_async(self, mock_lite_result) -> None:
+        mock_extract_result = MagicMock()
+        mock_extract_result.entities = mock_lite_result.model_dump()
+        mock_ls_instance = MagicMock()
+        mock_ls_instance.extract.return_value = [mock_extract_result] * 2
+        mock_ls_class = MagicMock(return_value=mock_ls_instance)
+
+        with patch.dict(
+            "sys.modules", {"langstruct": MagicMock(LangStruct=mock_ls_class)}
+        ):
+            extractor = LangStructExtractor()
+            results = asyncio.run(
+                extractor.extract_many_async(["text 1", "text 2"], max_workers=4)
+            )
+
+        assert results == [mock_lite_result, mock_lite_result]
+        mock_ls_instance.extract.assert_called_once_with(
+            ["text 1", "text 2"], max_workers=4
+        )
+
+    def test_extract_many_async_empty(self) -> None:
+        extractor = LangStructExtractor()
+        assert asyncio.run(extractor.extract_many_async([])) == []
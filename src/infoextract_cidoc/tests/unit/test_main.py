@@ -0,0 +1,360 @@
+"""Unit tests for the CLI helpers in main.py."""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+import dotenv
+import orjson
+import pytest
+
+from infoextract_cidoc import main
+from infoextract_cidoc.extraction.lite_schema import (
+    LiteEntity,
+    LiteExtractionResult,
+    LiteRelationship,
+)
+
+
+def _entity(ref_id: str, confidence: float) -> LiteEntity:
+    return LiteEntity(
+        ref_id=ref_id, entity_type="Person", label=ref_id, confidence=confidence
+    )
+
+
+@pytest.fixture
+def lite_result() -> LiteExtractionResult:
+    return LiteExtractionResult(
+        entities=[_entity("person_1", 0.9), _entity("person_2", 0.2)],
+        relationships=[
+            LiteRelationship(
+                source_ref="person_1",
+                target_ref="person_2",
+                property_code="P107",
+                property_label="has current or former member",
+                confidence=0.9,
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def clear_env_caches():
+    main._load_env.cache_clear()
+    main._configured_api_keys.cache_clear()
+    yield
+    main._load_env.cache_clear()
+    main._configured_api_keys.cache_clear()
+
+
+@pytest.mark.unit
+class TestFilterByConfidence:
+    def test_zero_threshold_returns_same_object(self, lite_result) -> None:
+        assert main._filter_by_confidence(lite_result, 0.0) is lite_result
+
+    def test_nothing_dropped_returns_same_object(self, lite_result) -> None:
+        assert main._filter_by_confidence(lite_result, 0.1) is lite_result
+
+    def test_dangling_relationships_are_dropped(self, lite_result) -> None:
+        filtered = main._filter_by_confidence(lite_result, 0.5)
+
+        assert [e.ref_id for e in filtered.entities] == ["person_1"]
+        assert filtered.relationships == []
+        assert len(lite_result.entities) == 2  # Input is left untouched
+
+
+@pytest.mark.unit
+class TestExpandInputFiles:
+    @pytest.fixture
+    def input_dir(self, tmp_path):
+        for name in ("b.txt", "a.txt", "notes.md"):
+            (tmp_path / name).write_text(name, encoding="utf-8")
+        (tmp_path / "nested").mkdir()
+        return tmp_path
+
+    def test_directory_lists_files_sorted(self, input_dir) -> None:
+        assert [p.name for p in main._expand_input_files(str(input_dir))] == [
+            "a.txt",
+            "b.txt",
+            "notes.md",
+        ]
+
+    def test_absolute_glob(self, input_dir) -> None:
+        paths = main._expand_input_files(str(input_dir / "*.txt"))
+
+        assert [p.name for p in paths] == ["a.txt", "b.txt"]
+
+    def test_relative_glob(self, input_dir, monkeypatch) -> None:
+        monkeypatch.chdir(input_dir)
+
+        assert main._expand_input_files("*.md") == [Path("notes.md")]
+
+
+@pytest.mark.unit
+class TestOutputDirs:
+    def test_unique_stems_use_the_stem(self, tmp_path) -> None:
+        paths = [tmp_path / "a.txt", tmp_path / "b.md"]
+
+        assert main._output_dirs(paths, Path("out")) == [Path("out/a"), Path("out/b")]
+
+    def test_repeated_stems_use_relative_paths(self, tmp_path) -> None:
+        paths = [tmp_path / "a.md", tmp_path / "a.txt", tmp_path / "x" / "a.txt"]
+
+        assert main._output_dirs(paths, Path("out")) == [
+            Path("out/a.md"),
+            Path("out/a.txt"),
+            Path("out/x/a.txt"),
+        ]
+
+
+@pytest.mark.unit
+class TestLoadOrCompute:
+    def test_cache_hit_skips_compute(self, tmp_path) -> None:
+        path = tmp_path / "entry.json"
+        calls: list[int] = []
+
+        def compute() -> dict[str, int]:
+            calls.append(1)
+            return {"a": 1}
+
+        assert main._load_or_compute(path, compute) == {"a": 1}
+        assert main._load_or_compute(path, compute) == {"a": 1}
+        assert calls == [1]
+        assert list(tmp_path.iterdir()) == [path]  # No tmp file left behind
+
+    def test_corrupt_entry_is_recomputed(self, tmp_path) -> None:
+        path = tmp_path / "entry.json"
+        path.write_bytes(b"{")
+
+        assert main._load_or_compute(path, lambda: [1]) == [1]
+        assert orjson.loads(path.read_bytes()) == [1]
+
+    def test_no_path_always_computes(self) -> None:
+        assert main._load_or_compute(None, lambda: 1) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("clear_env_caches")
+class TestApiKeyCheck:
+    @pytest.fixture(autouse=True)
+    def _no_keys(self, monkeypatch):
+        monkeypatch.setenv("INFOEXTRACT_SKIP_DOTENV", "1")
+        for name in main._API_KEY_VARS:
+            monkeypatch.delenv(name, raising=False)
+
+    def test_missing_key_raises(self) -> None:
+        with pytest.raises(main.MissingAPIKeyError, match="OPENAI_API_KEY"):
+            main.check_api_key()
+
+    def test_any_key_is_enough(self, monkeypatch) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+        main.check_api_key()
+
+    def test_skip_dotenv_does_not_read_env_file(self, monkeypatch) -> None:
+        calls: list[int] = []
+        monkeypatch.setattr(dotenv, "load_dotenv", lambda: calls.append(1))
+
+        main._load_env()
+
+        assert calls == []
+
+
+@pytest.mark.unit
+class TestRunMany:
+    def test_failed_document_does_not_stop_the_others(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        for name in ("good", "bad"):
+            (tmp_path / f"{name}.txt").write_text(name, encoding="utf-8")
+
+        async def failing_batch(*_args, **_kwargs):
+            msg = "batch failed"
+            raise RuntimeError(msg)
+
+        async def extract_one(text, **_kwargs):
+            if text == "bad":
+                msg = "bad document"
+                raise ValueError(msg)
+            return (text,)
+
+        monkeypatch.setattr(main, "_run_extraction_batch", failing_batch)
+        monkeypatch.setattr(main, "_run_extraction", extract_one)
+        written: list[str] = []
+
+        async def write_outputs(_text, _extraction, output_dir) -> None:
+            written.append(output_dir.name)
+
+        with pytest.raises(ExceptionGroup) as excinfo:
+            asyncio.run(
+                main._run_many(
+                    main._expand_input_files(str(tmp_path)),
+                    tmp_path / "out",
+                    write_outputs,
+                    max_concurrency=2,
+                )
+            )
+
+        assert written == ["good"]
+        assert [str(e) for e in excinfo.value.exceptions] == ["bad document"]
+
+    def test_failed_writer_does_not_stop_the_others(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.txt").write_text(name, encoding="utf-8")
+
+        async def batch(texts, **_kwargs):
+            return [(text,) for text in texts]
+
+        monkeypatch.setattr(main, "_run_extraction_batch", batch)
+        written: list[str] = []
+
+        async def write_outputs(text, _extraction, _output_dir) -> None:
+            if text == "a":
+                msg = "disk full"
+                raise OSError(msg)
+            written.append(text)
+
+        with pytest.raises(ExceptionGroup, match="1 of 2 documents failed"):
+            asyncio.run(
+                main._run_many(
+                    main._expand_input_files(str(tmp_path)),
+                    tmp_path / "out",
+                    write_outputs,
+                    max_concurrency=2,
+                )
+            )
+
+        assert written == ["b"]
+
+    def test_non_exception_errors_are_reraised(self, monkeypatch, tmp_path) -> None:
+        class Abort(BaseException):
+            pass
+
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.txt").write_text(name, encoding="utf-8")
+
+        async def batch(texts, **_kwargs):
+            return [Abort() if text == "a" else (text,) for text in texts]
+
+        monkeypatch.setattr(main, "_run_extraction_batch", batch)
+        written: list[str] = []
+
+        async def write_outputs(text, _extraction, _output_dir) -> None:
+            written.append(text)
+
+        with pytest.raises(Abort):
+            asyncio.run(
+                main._run_many(
+                    main._expand_input_files(str(tmp_path)),
+                    tmp_path / "out",
+                    write_outputs,
+                    max_concurrency=2,
+                )
+            )
+
+        assert written == ["b"]
+
+    def test_unreadable_file_does_not_stop_the_others(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        (tmp_path / "good.txt").write_text("good", encoding="utf-8")
+        (tmp_path / "latin.txt").write_bytes(b"\xff\xfe")
+        batches: list[list[str]] = []
+
+        async def batch(texts, **_kwargs):
+            batches.append(texts)
+            return [(text,) for text in texts]
+
+        monkeypatch.setattr(main, "_run_extraction_batch", batch)
+        written: list[str] = []
+
+        async def write_outputs(text, _extraction, _output_dir) -> None:
+            written.append(text)
+
+        with pytest.raises(ExceptionGroup) as excinfo:
+            asyncio.run(
+                main._run_many(
+                    main._expand_input_files(str(tmp_path)),
+                    tmp_path / "out",
+                    write_outputs,
+                    max_concurrency=2,
+                )
+            )
+
+        assert batches == [["good"]]
+        assert written == ["good"]
+        assert excinfo.group_contains(UnicodeDecodeError)
+
+    def test_same_stem_documents_write_to_separate_dirs(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        for folder in ("x", "y"):
+            (tmp_path / folder).mkdir()
+            (tmp_path / folder / "bio.txt").write_text(folder, encoding="utf-8")
+
+        async def batch(texts, **_kwargs):
+            return [(text,) for text in texts]
+
+        monkeypatch.setattr(main, "_run_extraction_batch", batch)
+        written: dict[Path, str] = {}
+
+        async def write_outputs(text, _extraction, output_dir) -> None:
+            written[output_dir] = text
+
+        out = tmp_path / "out"
+        asyncio.run(
+            main._run_many(
+                main._expand_input_files(str(tmp_path / "*" / "*.txt")),
+                out,
+                write_outputs,
+                max_concurrency=2,
+            )
+        )
+
+        assert written == {out / "x" / "bio.txt": "x", out / "y" / "bio.txt": "y"}
+
+
+@pytest.mark.unit
+class TestAnalyzeCache:
+    def _analyze(self, input_file, output_dir, cache_dir, *, no_validate):
+        args = argparse.Namespace(
+            input=str(input_file),
+            output=str(output_dir),
+            no_validate=no_validate,
+            no_cache=False,
+            cache_dir=cache_dir,
+            pretty=False,
+            centrality=True,
+            communities=False,
+            visualize=False,
+            export_cypher=False,
+        )
+        asyncio.run(main.handle_analyze_command(args))
+        return orjson.loads((output_dir / "centrality_measures.json").read_bytes())
+
+    def test_validate_mode_is_part_of_the_key(self, tmp_path) -> None:
+        assert main._analysis_cache_dir(
+            b"[]", tmp_path, validate=True
+        ) != main._analysis_cache_dir(b"[]", tmp_path, validate=False)
+
+    def test_raw_run_does_not_serve_validated_run(self, tmp_path) -> None:
+        input_file = tmp_path / "entities.json"
+        input_file.write_bytes(
+            orjson.dumps(
+                [
+                    {"id": "a", "class_code": "E21", "label": "A"},
+                    {"id": "b", "class_code": "E53", "label": "B"},
+                ]
+            )
+        )
+        cache_dir = tmp_path / "cache"
+
+        raw = self._analyze(input_file, tmp_path / "raw", cache_dir, no_validate=True)
+        validated = self._analyze(
+            input_file, tmp_path / "validated", cache_dir, no_validate=False
+        )
+
+        assert set(raw["degree"]) == {"a", "b"}
+        assert set(validated["degree"]).isdisjoint({"a", "b"})
@@ -51,6 +51,18 @@ class TestMarkdownRendering:
         assert "**Label** (`label`): Ancient Vase" in markdown
         assert "**Notes** (`notes`): A beautiful amphora" in markdown
 
+    def test_detailed_rendering_includes_shortcut_fields(self):
+        """Test that detailed rendering lists subclass shortcut fields."""
+        production_id = uuid4()
+        entity = E22_HumanMadeObject(
+            id=uuid4(), class_code="E22", produced_by=production_id
+        )
+
+        markdown = to_markdown(entity, MarkdownStyle.DETAILED)
+
+        assert f"(`produced_by`): {str(production_id)[:8]}" in markdown
+        assert "(`class_code`)" not in markdown
+
     def test_table_rendering(self):
         """Test table-style rendering."""
         entities = [
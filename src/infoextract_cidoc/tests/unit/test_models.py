@@ -0,0 +1,135 @@
+"""
+Unit tests for the base CRM models.
+"""
+
+import json
+import sys
+from uuid import UUID, uuid4
+
+from ...models import (
+    CLASS_BY_CODE,
+    ENTITY_LIST_ADAPTER,
+    SUBCLASS_CODES,
+    CRMEntity,
+    CRMRelation,
+    E5_Event,
+    E7_Activity,
+    E8_Acquisition,
+    E12_Production,
+    E21_Person,
+    E53_Place,
+)
+
+
+class TestStringIdConversion:
+    """Test conversion of string IDs to UUIDs."""
+
+    def test_uuid_string_is_parsed(self):
+        """A UUID string is used as-is."""
+        uid = uuid4()
+        entity = CRMEntity(id=str(uid), class_code="E22")
+
+        assert entity.id == uid
+
+    def test_non_uuid_string_is_deterministic(self):
+        """The same non-UUID string always maps to the same UUID."""
+        first = CRMEntity(id="obj_001", class_code="E22")
+        second = CRMEntity(id="obj_001", class_code="E22")
+
+        assert isinstance(first.id, UUID)
+        assert first.id == second.id
+        assert first.id != CRMEntity(id="obj_002", class_code="E22").id
+
+    def test_relation_endpoints_match_entity_ids(self):
+        """Relations referencing string IDs resolve to the entities' UUIDs."""
+        obj = CRMEntity(id="obj_001", class_code="E22")
+        prod = CRMEntity(id="prod_001", class_code="E12")
+        relation = CRMRelation(src="obj_001", type="P108", tgt="prod_001")
+
+        assert relation.src == obj.id
+        assert relation.tgt == prod.id
+
+
+class TestEntityListAdapter:
+    """Test polymorphic entity list validation."""
+
+    def test_dicts_validate_to_wrapper_classes(self):
+        """class_code picks the core wrapper class, keeping shortcut fields."""
+        place_id = uuid4()
+        entities = ENTITY_LIST_ADAPTER.validate_python(
+            [
+                {"class_code": "E5", "label": "Birth", "took_place_at": str(place_id)},
+                {"class_code": "E53", "label": "Ulm"},
+                {"class_code": "E99", "label": "Unknown"},
+            ]
+        )
+
+        assert [type(entity) for entity in entities] == [
+            E5_Event,
+            E53_Place,
+            CRMEntity,
+        ]
+        assert entities[0].took_place_at == place_id
+
+    def test_json_round_trip_keeps_subclass(self):
+        """Wrapper instances survive a dump/validate round trip."""
+        event = E5_Event(label="Birth", took_place_at=uuid4())
+        plain = CRMEntity(class_code="E21", label="Einstein")
+
+        data = ENTITY_LIST_ADAPTER.dump_json([event, plain], serialize_as_any=True)
+        restored = ENTITY_LIST_ADAPTER.validate_json(data)
+
+        assert restored[0] == event
+        assert isinstance(restored[1], E21_Person)
+        assert restored[1].label == "Einstein"
+
+
+class TestFieldInheritance:
+    """Test that E-class hierarchies do not re-declare inherited fields."""
+
+    def test_subclasses_only_override_class_code(self):
+        """Shortcut fields are declared once, on the class introducing them."""
+        from ...models.generated import e_classes
+
+        classes = [
+            *(cls for cls in vars(e_classes).values() if isinstance(cls, type)),
+            E5_Event,
+            E7_Activity,
+            E8_Acquisition,
+            E12_Production,
+        ]
+        for cls in classes:
+            if not issubclass(cls, CRMEntity) or cls is CRMEntity:
+                continue
+            inherited = set(cls.__mro__[1].model_fields)
+            redeclared = set(cls.__annotations__) & inherited - {"class_code"}
+            assert not redeclared, f"{cls.__name__} re-declares {redeclared}"
+
+
+class TestClassCodeDispatch:
+    """Test the class_code dispatch tables."""
+
+    def test_class_by_code(self):
+        """Each wrapper class is reachable from its class code."""
+        assert CLASS_BY_CODE["E5"] is E5_Event
+        assert CLASS_BY_CODE["E53"] is E53_Place
+        assert "E99" not in CLASS_BY_CODE
+
+    def test_subclass_codes_follow_hierarchy(self):
+        """Subclass code sets include the class itself and its descendants."""
+        assert SUBCLASS_CODES["E5"] == {"E5", "E7", "E8", "E12"}
+        assert SUBCLASS_CODES["E7"] == {"E7", "E8", "E12"}
+        assert SUBCLASS_CODES["E21"] == {"E21"}
+
+    def test_class_code_is_interned(self):
+        """Codes parsed from JSON share the interned string object."""
+        entity = CRMEntity.model_validate(json.loads('{"class_code": "E21"}'))
+
+        assert entity.class_code is sys.intern("E21")
+
+    def test_entity_class_for_generated_classes(self):
+        """Every generated E-class is reachable from its class code."""
+        from ...models.generated import e_classes
+
+        assert e_classes.entity_class_for("E67") is e_classes.E67_Birth
+        assert e_classes.entity_class_for("E22") is e_classes.E22_HumanMadeObject
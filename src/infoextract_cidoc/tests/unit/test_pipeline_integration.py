@@ -1,5 +1,6 @@
 """End-to-end pipeline integration tests: LiteExtractionResult -> outputs."""
 
+import orjson
 import pytest
 
 from infoextract_cidoc.extraction import (
@@ -14,6 +15,7 @@ from infoextract_cidoc.extraction.lite_schema import (
 from infoextract_cidoc.io.to_cypher import generate_cypher_script
 from infoextract_cidoc.io.to_markdown import MarkdownStyle, render_table, to_markdown
 from infoextract_cidoc.io.to_networkx import to_networkx_graph
+from infoextract_cidoc.models import ENTITY_LIST_ADAPTER
 
 
 @pytest.fixture
@@ -140,6 +142,19 @@ class TestPipelineIntegration:
         graph = to_networkx_graph(entities)
         assert graph.number_of_nodes() == 4
 
+    def test_pipeline_entity_list_json_round_trip(
+        self, einstein_lite_result: LiteExtractionResult
+    ) -> None:
+        """One dump_json call matches per-entity dumps, subclass fields included."""
+        extraction_result = resolve_extraction(einstein_lite_result)
+        entities, _ = map_to_crm_entities(extraction_result)
+
+        payload = ENTITY_LIST_ADAPTER.dump_json(entities, serialize_as_any=True)
+
+        assert orjson.loads(payload) == [e.model_dump(mode="json") for e in entities]
+        round_tripped = ENTITY_LIST_ADAPTER.validate_json(payload)
+        assert [e.id for e in round_tripped] == [e.id for e in entities]
+
     def test_pipeline_broken_links_excluded(self) -> None:
         """Broken relationship refs should be silently excluded."""
         lite_result = LiteExtractionResult(
@@ -8,11 +8,12 @@ from enum import Enum
 from typing import Any
 
 from infoextract_cidoc.models.base import (
+    PROPERTY_FIELDS,
     CRMEntity,
     CRMValidationError,
     CRMValidationWarning,
 )
-from infoextract_cidoc.properties import P
+from infoextract_cidoc.properties import DOMAIN, P
 
 logger = logging.getLogger(__name__)
 
@@ -97,8 +98,6 @@ def validate_entity_quantifiers(
     messages = []
 
     # Get all properties that apply to this entity's class
-    from infoextract_cidoc.properties import DOMAIN
-
     applicable_properties = DOMAIN.get(entity.class_code, [])
 
     for p_code in applicable_properties:
@@ -179,21 +178,7 @@ def _get_property_values(entity: CRMEntity, p_code: str) -> list[Any]:
     Returns:
         List of values for the property
     """
-    # Map P-codes to entity fields
-    p_to_field = {
-        "P1": "identifiers",
-        "P2": "type",
-        "P3": "notes",
-        "P4": "timespan",
-        "P7": "took_place_at",
-        "P11": "participants",
-        "P53": "current_location",
-        "P79": "begin_of_the_begin",
-        "P80": "end_of_the_end",
-        "P108": "produced_by",
-    }
-
-    field_name = p_to_field.get(p_code)
+    field_name = PROPERTY_FIELDS.get(p_code)
     if not field_name:
         return []
 
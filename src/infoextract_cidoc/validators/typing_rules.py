@@ -7,6 +7,7 @@ import logging
 from typing import Any
 
 from infoextract_cidoc.models.base import (
+    PROPERTY_FIELDS,
     CRMEntity,
     CRMValidationError,
     CRMValidationWarning,
@@ -17,6 +18,110 @@ from .quantifiers import ValidationSeverity
 
 logger = logging.getLogger(__name__)
 
+# Ancestor class codes of each E-class. This is a simplified version - in
+# practice, you'd want to load the full inheritance hierarchy from the YAML
+# specs
+_INHERITANCE_MAP: dict[str, list[str]] = {
+    "E2": ["E1"],
+    "E3": ["E2", "E1"],
+    "E4": ["E2", "E1"],
+    "E5": ["E2", "E1"],
+    "E6": ["E5", "E2", "E1"],
+    "E7": ["E5", "E2", "E1"],
+    "E8": ["E7", "E5", "E2", "E1"],
+    "E9": ["E7", "E5", "E2", "E1"],
+    "E10": ["E7", "E5", "E2", "E1"],
+    "E11": ["E7", "E5", "E2", "E1"],
+    "E12": ["E7", "E5", "E2", "E1"],
+    "E13": ["E7", "E5", "E2", "E1"],
+    "E14": ["E13", "E7", "E5", "E2", "E1"],
+    "E15": ["E13", "E7", "E5", "E2", "E1"],
+    "E16": ["E13", "E7", "E5", "E2", "E1"],
+    "E17": ["E13", "E7", "E5", "E2", "E1"],
+    "E18": ["E1"],
+    "E19": ["E18", "E1"],
+    "E20": ["E19", "E18", "E1"],
+    "E21": ["E20", "E19", "E18", "E1"],
+    "E22": ["E19", "E18", "E1"],
+    "E23": ["E1"],
+    "E24": ["E18", "E1"],
+    "E25": ["E24", "E18", "E1"],
+    "E26": ["E18", "E1"],
+    "E27": ["E26", "E18", "E1"],
+    "E28": ["E23", "E1"],
+    "E29": ["E28", "E23", "E1"],
+    "E30": ["E28", "E23", "E1"],
+    "E31": ["E28", "E23", "E1"],
+    "E32": ["E31", "E28", "E23", "E1"],
+    "E33": ["E28", "E23", "E1"],
+    "E34": ["E33", "E28", "E23", "E1"],
+    "E35": ["E33", "E28", "E23", "E1"],
+    "E36": ["E28", "E23", "E1"],
+    "E37": ["E36", "E28", "E23", "E1"],
+    "E38": ["E36", "E28", "E23", "E1"],
+    "E39": ["E1"],
+    "E40": ["E39", "E1"],
+    "E41": ["E28", "E23", "E1"],
+    "E42": ["E28", "E23", "E1"],
+    "E43": ["E1"],
+    "E44": ["E41", "E28", "E23", "E1"],
+    "E45": ["E44", "E41", "E28", "E23", "E1"],
+    "E46": ["E43", "E1"],
+    "E47": ["E28", "E23", "E1"],
+    "E48": ["E44", "E41", "E28", "E23", "E1"],
+    "E49": ["E41", "E28", "E23", "E1"],
+    "E50": ["E49", "E41", "E28", "E23", "E1"],
+    "E51": ["E45", "E44", "E41", "E28", "E23", "E1"],
+    "E52": ["E1"],
+    "E53": ["E43", "E1"],
+    "E54": ["E28", "E23", "E1"],
+    "E55": ["E28", "E23", "E1"],
+    "E56": ["E55", "E28", "E23", "E1"],
+    "E57": ["E55", "E28", "E23", "E1"],
+    "E58": ["E55", "E28", "E23", "E1"],
+    "E59": ["E1"],
+    "E60": ["E59", "E1"],
+    "E61": ["E59", "E1"],
+    "E62": ["E59", "E1"],
+    "E63": ["E5", "E2", "E1"],
+    "E64": ["E5", "E2", "E1"],
+    "E65": ["E63", "E5", "E2", "E1"],
+    "E66": ["E63", "E5", "E2", "E1"],
+    "E67": ["E66", "E63", "E5", "E2", "E1"],
+    "E68": ["E64", "E5", "E2", "E1"],
+    "E69": ["E64", "E5", "E2", "E1"],
+    "E70": ["E1"],
+    "E71": ["E70", "E1"],
+    "E72": ["E70", "E1"],
+    "E73": ["E70", "E1"],
+    "E74": ["E39", "E1"],
+    "E75": ["E41", "E28", "E23", "E1"],
+    "E76": ["E42", "E28", "E23", "E1"],
+    "E77": ["E1"],
+    "E78": ["E77", "E1"],
+    "E79": ["E11", "E7", "E5", "E2", "E1"],
+    "E80": ["E11", "E7", "E5", "E2", "E1"],
+    "E81": ["E11", "E7", "E5", "E2", "E1"],
+    "E82": ["E75", "E41", "E28", "E23", "E1"],
+    "E83": ["E65", "E63", "E5", "E2", "E1"],
+    "E84": ["E73", "E70", "E1"],
+    "E85": ["E7", "E5", "E2", "E1"],
+    "E86": ["E7", "E5", "E2", "E1"],
+    "E87": ["E7", "E5", "E2", "E1"],
+    "E88": ["E28", "E23", "E1"],
+    "E89": ["E88", "E28", "E23", "E1"],
+    "E90": ["E28", "E23", "E1"],
+    "E91": ["E90", "E28", "E23", "E1"],
+    "E92": ["E1"],
+    "E93": ["E92", "E1"],
+    "E94": ["E92", "E1"],
+    "E95": ["E59", "E1"],
+    "E96": ["E92", "E1"],
+    "E97": ["E28", "E23", "E1"],
+    "E98": ["E55", "E28", "E23", "E1"],
+    "E99": ["E55", "E28", "E23", "E1"],
+}
+
 
 def validate_domain_range_alignment(
     source_entity: CRMEntity,
@@ -148,112 +253,8 @@ def _is_class_compatible(entity_class: str, expected_class: str) -> bool:
     if entity_class == expected_class:
         return True
 
-    # Check inheritance hierarchy
-    # This is a simplified version - in practice, you'd want to load
-    # the full inheritance hierarchy from the YAML specs
-    inheritance_map = {
-        "E2": ["E1"],
-        "E3": ["E2", "E1"],
-        "E4": ["E2", "E1"],
-        "E5": ["E2", "E1"],
-        "E6": ["E5", "E2", "E1"],
-        "E7": ["E5", "E2", "E1"],
-        "E8": ["E7", "E5", "E2", "E1"],
-        "E9": ["E7", "E5", "E2", "E1"],
-        "E10": ["E7", "E5", "E2", "E1"],
-        "E11": ["E7", "E5", "E2", "E1"],
-        "E12": ["E7", "E5", "E2", "E1"],
-        "E13": ["E7", "E5", "E2", "E1"],
-        "E14": ["E13", "E7", "E5", "E2", "E1"],
-        "E15": ["E13", "E7", "E5", "E2", "E1"],
-        "E16": ["E13", "E7", "E5", "E2", "E1"],
-        "E17": ["E13", "E7", "E5", "E2", "E1"],
-        "E18": ["E1"],
-        "E19": ["E18", "E1"],
-        "E20": ["E19", "E18", "E1"],
-        "E21": ["E20", "E19", "E18", "E1"],
-        "E22": ["E19", "E18", "E1"],
-        "E23": ["E1"],
-        "E24": ["E18", "E1"],
-        "E25": ["E24", "E18", "E1"],
-        "E26": ["E18", "E1"],
-        "E27": ["E26", "E18", "E1"],
-        "E28": ["E23", "E1"],
-        "E29": ["E28", "E23", "E1"],
-        "E30": ["E28", "E23", "E1"],
-        "E31": ["E28", "E23", "E1"],
-        "E32": ["E31", "E28", "E23", "E1"],
-        "E33": ["E28", "E23", "E1"],
-        "E34": ["E33", "E28", "E23", "E1"],
-        "E35": ["E33", "E28", "E23", "E1"],
-        "E36": ["E28", "E23", "E1"],
-        "E37": ["E36", "E28", "E23", "E1"],
-        "E38": ["E36", "E28", "E23", "E1"],
-        "E39": ["E1"],
-        "E40": ["E39", "E1"],
-        "E41": ["E28", "E23", "E1"],
-        "E42": ["E28", "E23", "E1"],
-        "E43": ["E1"],
-        "E44": ["E41", "E28", "E23", "E1"],
-        "E45": ["E44", "E41", "E28", "E23", "E1"],
-        "E46": ["E43", "E1"],
-        "E47": ["E28", "E23", "E1"],
-        "E48": ["E44", "E41", "E28", "E23", "E1"],
-        "E49": ["E41", "E28", "E23", "E1"],
-        "E50": ["E49", "E41", "E28", "E23", "E1"],
-        "E51": ["E45", "E44", "E41", "E28", "E23", "E1"],
-        "E52": ["E1"],
-        "E53": ["E43", "E1"],
-        "E54": ["E28", "E23", "E1"],
-        "E55": ["E28", "E23", "E1"],
-        "E56": ["E55", "E28", "E23", "E1"],
-        "E57": ["E55", "E28", "E23", "E1"],
-        "E58": ["E55", "E28", "E23", "E1"],
-        "E59": ["E1"],
-        "E60": ["E59", "E1"],
-        "E61": ["E59", "E1"],
-        "E62": ["E59", "E1"],
-        "E63": ["E5", "E2", "E1"],
-        "E64": ["E5", "E2", "E1"],
-        "E65": ["E63", "E5", "E2", "E1"],
-        "E66": ["E63", "E5", "E2", "E1"],
-        "E67": ["E66", "E63", "E5", "E2", "E1"],
-        "E68": ["E64", "E5", "E2", "E1"],
-        "E69": ["E64", "E5", "E2", "E1"],
-        "E70": ["E1"],
-        "E71": ["E70", "E1"],
-        "E72": ["E70", "E1"],
-        "E73": ["E70", "E1"],
-        "E74": ["E39", "E1"],
-        "E75": ["E41", "E28", "E23", "E1"],
-        "E76": ["E42", "E28", "E23", "E1"],
-        "E77": ["E1"],
-        "E78": ["E77", "E1"],
-        "E79": ["E11", "E7", "E5", "E2", "E1"],
-        "E80": ["E11", "E7", "E5", "E2", "E1"],
-        "E81": ["E11", "E7", "E5", "E2", "E1"],
-        "E82": ["E75", "E41", "E28", "E23", "E1"],
-        "E83": ["E65", "E63", "E5", "E2", "E1"],
-        "E84": ["E73", "E70", "E1"],
-        "E85": ["E7", "E5", "E2", "E1"],
-        "E86": ["E7", "E5", "E2", "E1"],
-        "E87": ["E7", "E5", "E2", "E1"],
-        "E88": ["E28", "E23", "E1"],
-        "E89": ["E88", "E28", "E23", "E1"],
-        "E90": ["E28", "E23", "E1"],
-        "E91": ["E90", "E28", "E23", "E1"],
-        "E92": ["E1"],
-        "E93": ["E92", "E1"],
-        "E94": ["E92", "E1"],
-        "E95": ["E59", "E1"],
-        "E96": ["E92", "E1"],
-        "E97": ["E28", "E23", "E1"],
-        "E98": ["E55", "E28", "E23", "E1"],
-        "E99": ["E55", "E28", "E23", "E1"],
-    }
-
     # Check if expected_class is in the inheritance chain
-    inheritance_chain = inheritance_map.get(entity_class, [])
+    inheritance_chain = _INHERITANCE_MAP.get(entity_class, [])
     return expected_class in inheritance_chain
 
 
@@ -268,21 +269,7 @@ def _get_property_target_ids(entity: CRMEntity, p_code: str) -> list[str]:
     Returns:
         List of target entity IDs
     """
-    # Map P-codes to entity fields
-    p_to_field = {
-        "P1": "identifiers",
-        "P2": "type",
-        "P3": "notes",
-        "P4": "timespan",
-        "P7": "took_place_at",
-        "P11": "participants",
-        "P53": "current_location",
-        "P79": "begin_of_the_begin",
-        "P80": "end_of_the_end",
-        "P108": "produced_by",
-    }
-
-    field_name = p_to_field.get(p_code)
+    field_name = PROPERTY_FIELDS.get(p_code)
     if not field_name:
         return []
 
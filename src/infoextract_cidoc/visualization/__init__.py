@@ -6,24 +6,45 @@ for NetworkX graphs containing CRM entities and relationships.
 Interactive visualizations are designed for Jupyter notebook use.
 """
 
-from .export import (
-    create_network_summary,
-    export_plot,
-)
-from .plotting import (
-    create_interactive_plot,
-    plot_centrality_network,
-    plot_community_network,
-    plot_network_graph,
-    plot_temporal_network,
-)
-from .styling import (
-    create_legend,
-    get_edge_colors,
-    get_layout_positions,
-    get_node_colors,
-    get_node_sizes,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .export import (
+        create_network_summary,
+        export_plot,
+    )
+    from .plotting import (
+        create_interactive_plot,
+        plot_centrality_network,
+        plot_community_network,
+        plot_network_graph,
+        plot_temporal_network,
+    )
+    from .styling import (
+        create_legend,
+        get_edge_colors,
+        get_layout_positions,
+        get_node_colors,
+        get_node_sizes,
+    )
+
+# Submodule defining each public name. They are imported on first access so
+# that e.g. create_network_summary does not drag in matplotlib.pyplot.
+_EXPORTS = {
+    "create_network_summary": ".export",
+    "export_plot": ".export",
+    "create_interactive_plot": ".plotting",
+    "plot_centrality_network": ".plotting",
+    "plot_community_network": ".plotting",
+    "plot_network_graph": ".plotting",
+    "plot_temporal_network": ".plotting",
+    "create_legend": ".styling",
+    "get_edge_colors": ".styling",
+    "get_layout_positions": ".styling",
+    "get_node_colors": ".styling",
+    "get_node_sizes": ".styling",
+}
 
 __all__ = [
     "create_interactive_plot",
@@ -39,3 +60,18 @@ __all__ = [
     "plot_network_graph",
     "plot_temporal_network",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
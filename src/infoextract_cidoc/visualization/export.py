@@ -5,17 +5,24 @@ This module provides functions for exporting plots and creating
 network summaries in various formats.
 """
 
-import json
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import matplotlib.pyplot as plt
 import networkx as nx
-import pandas as pd
+import orjson
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Same layout as json.dump(indent=2); int keys (e.g. degree histograms) are
+# stringified as the json module did.
+_JSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+)
 
 
 def export_plot(
-    fig: plt.Figure,
+    fig: "Figure",
     filepath: str,
     *,
     format: str = "png",
@@ -116,8 +123,7 @@ def export_network_data(
     if format == "json":
         # Export as JSON
         data = nx.node_link_data(graph)
-        with Path(filepath).open("w") as f:
-            json.dump(data, f, indent=2)
+        Path(filepath).write_bytes(orjson.dumps(data, option=_JSON_OPTIONS))
 
     elif format == "gexf":
         # Export as GEXF
@@ -163,6 +169,8 @@ def create_network_report(
 
     # Create plots
     if include_plots:
+        import matplotlib.pyplot as plt  # noqa: PLC0415
+
         plots_dir = output_path / "plots"
         plots_dir.mkdir(exist_ok=True)
 
@@ -208,8 +216,7 @@ def create_network_report(
     if include_summary:
         summary = create_network_summary(graph)
         summary_file = output_path / "summary.json"
-        with summary_file.open("w") as f:
-            json.dump(summary, f, indent=2)
+        summary_file.write_bytes(orjson.dumps(summary, option=_JSON_OPTIONS))
 
     return str(output_path)
 
@@ -275,6 +282,8 @@ def _get_community_summary(graph: nx.Graph) -> dict[str, Any]:
 
 def _export_to_csv(graph: nx.Graph, filepath: str, include_attributes: bool) -> None:
     """Export graph to CSV files."""
+    import pandas as pd  # noqa: PLC0415
+
     base_path = Path(filepath).with_suffix("")
 
     # Export nodes
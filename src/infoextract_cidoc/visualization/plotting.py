@@ -12,6 +12,8 @@ import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
 import plotly.graph_objects as go
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
 
 def plot_network_graph(
@@ -28,6 +30,7 @@ def plot_network_graph(
     label_font_size: int = 8,
     save_path: str | None = None,
     show_plot: bool = True,
+    ax: Axes | None = None,
 ) -> plt.Figure:
     """
     Create a static network plot using matplotlib.
@@ -45,11 +48,20 @@ def plot_network_graph(
         label_font_size: Font size for labels
         save_path: Path to save the plot
         show_plot: Whether to display the plot
+        ax: Existing axes to draw into (cleared first); figsize is then ignored
 
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    if ax is not None:
+        ax.clear()
+        parent = ax.figure
+        fig = parent if isinstance(parent, Figure) else parent.figure
+    else:
+        # Figures that are only saved bypass pyplot's global state, so they can
+        # be rendered from worker threads and are freed once the caller drops them.
+        fig = plt.figure(figsize=figsize) if show_plot else Figure(figsize=figsize)
+        ax = fig.subplots()
 
     # Get layout positions
     pos = _get_layout_positions(graph, layout)
@@ -80,11 +92,11 @@ def plot_network_graph(
     _create_legend(ax, graph, node_color)
 
     # Adjust layout
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save if requested
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
+        fig.savefig(save_path, dpi=300, bbox_inches="tight")
 
     # Show if requested
     if show_plot: